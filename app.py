@@ -8,11 +8,14 @@ import gradio as gr
 import os
 
 from src.config import get_hf_token, get_auto_fetch_on_startup, get_auto_retry_failed
+from src.logging_setup import setup_logging
 from src.papers import fetch_daily_papers
 from src.processor import extract_and_save_links, process_manual_url, retry_failed_jobs
 from src.database import load_database
 from src.ui import format_papers_display, get_database_stats, view_paper_details
 
+setup_logging()
+
 
 def refresh_papers(date_filter: str = None) -> str:
     """
@@ -48,14 +51,12 @@ def view_paper(paper_id: str) -> str:
         return "<p>Please enter a paper ID (e.g., 2307.09288)</p>"
 
     database = load_database()
-    papers = database.get("papers", [])
 
     # Find the paper
     paper = None
-    for p in papers:
-        if p.get("paper_id") == paper_id.strip():
-            paper = p
-            break
+    paper_idx = database["_index"].get(paper_id.strip())
+    if paper_idx is not None:
+        paper = database["papers"][paper_idx]
 
     if not paper:
         return f"<p>❌ Paper {paper_id} not found in database.</p>"
@@ -0,0 +1,3 @@
+from .logging_setup import install_fallback_handler
+
+install_fallback_handler()
@@ -2,6 +2,7 @@
 Claude CLI integration for automatic repository initialization.
 """
 
+import logging
 import os
 import subprocess
 import shutil
@@ -9,6 +10,8 @@ import sys
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+log = logging.getLogger(__name__)
+
 
 def check_claude_available() -> Optional[str]:
     """
@@ -92,13 +95,13 @@ def install_claude_cli(install_method: str = 'auto') -> Dict[str, Any]:
         result['claude_path'] = existing_path
         result['message'] = f"Claude CLI already installed at {existing_path}"
         result['method'] = 'existing'
-        print(f"ℹ️  {result['message']}")
+        log.info(f"ℹ️  {result['message']}")
         return result
 
     # Skip installation if method is 'skip'
     if install_method == 'skip':
         result['message'] = "Installation skipped by configuration"
-        print(f"⏭️  {result['message']}")
+        log.info(f"⏭️  {result['message']}")
         return result
 
     # Determine installation method
@@ -108,10 +111,10 @@ def install_claude_cli(install_method: str = 'auto') -> Dict[str, Any]:
             install_method = 'curl'
         else:
             result['message'] = f"Unsupported platform: {sys.platform}"
-            print(f"❌ {result['message']}")
+            log.error(f"❌ {result['message']}")
             return result
 
-    print(f"🔧 Attempting to install Claude CLI using {install_method}...")
+    log.info(f"🔧 Attempting to install Claude CLI using {install_method}...")
 
     try:
         if install_method == 'curl':
@@ -119,8 +122,8 @@ def install_claude_cli(install_method: str = 'auto') -> Dict[str, Any]:
             # According to docs: curl -fsSL https://claude.ai/install.sh | bash
             install_url = "https://claude.ai/install.sh"
 
-            print(f"   Downloading installation script from {install_url}")
-            print(f"   This may take a few minutes...")
+            log.info(f"   Downloading installation script from {install_url}")
+            log.info(f"   This may take a few minutes...")
 
             # Download and execute the install script
             # We pipe it through bash for execution
@@ -140,29 +143,29 @@ def install_claude_cli(install_method: str = 'auto') -> Dict[str, Any]:
                     result['success'] = True
                     result['claude_path'] = claude_path
                     result['message'] = f"Successfully installed Claude CLI at {claude_path}"
-                    print(f"   ✅ {result['message']}")
+                    log.info(f"   ✅ {result['message']}")
                 else:
                     result['message'] = "Installation completed but Claude CLI not found in PATH"
-                    print(f"   ⚠️  {result['message']}")
-                    print(f"   stdout: {process.stdout[:200]}")
-                    print(f"   stderr: {process.stderr[:200]}")
+                    log.warning(f"   ⚠️  {result['message']}")
+                    log.warning(f"   stdout: {process.stdout[:200]}")
+                    log.warning(f"   stderr: {process.stderr[:200]}")
             else:
                 result['message'] = f"Installation script failed (exit code {process.returncode})"
-                print(f"   ❌ {result['message']}")
+                log.error(f"   ❌ {result['message']}")
                 if process.stderr:
-                    print(f"   Error: {process.stderr[:500]}")
+                    log.error(f"   Error: {process.stderr[:500]}")
 
         else:
             result['message'] = f"Unknown installation method: {install_method}"
-            print(f"❌ {result['message']}")
+            log.error(f"❌ {result['message']}")
 
     except subprocess.TimeoutExpired:
         result['message'] = "Installation timed out after 5 minutes"
-        print(f"⏱️  {result['message']}")
+        log.error(f"⏱️  {result['message']}")
 
     except Exception as e:
         result['message'] = f"Installation failed: {str(e)}"
-        print(f"❌ {result['message']}")
+        log.error(f"❌ {result['message']}")
 
     return result
 
@@ -203,7 +206,7 @@ def run_claude_init(repo_path: str, claude_path: str, timeout: int = None) -> Di
             try:
                 timeout = int(timeout_str)
             except ValueError:
-                print(f"     ⚠️  Invalid CLAUDE_INIT_TIMEOUT value '{timeout_str}', using default 1800 seconds")
+                log.warning(f"     ⚠️  Invalid CLAUDE_INIT_TIMEOUT value '{timeout_str}', using default 1800 seconds")
                 timeout = 1800
 
     try:
@@ -216,10 +219,10 @@ def run_claude_init(repo_path: str, claude_path: str, timeout: int = None) -> Di
         claude_md_path = os.path.join(repo_path, 'CLAUDE.md')
         claude_md_existed_before = os.path.isfile(claude_md_path)
 
-        print(f"  🤖 Running claude /init in {repo_path}")
-        print(f"     Claude path: {claude_path}")
+        log.info(f"  🤖 Running claude /init in {repo_path}")
+        log.info(f"     Claude path: {claude_path}")
         if claude_md_existed_before:
-            print(f"     CLAUDE.md already exists, will reinitialize")
+            log.info(f"     CLAUDE.md already exists, will reinitialize")
 
         # Build command for claude /init
         # We use --print mode for non-interactive execution
@@ -233,9 +236,9 @@ def run_claude_init(repo_path: str, claude_path: str, timeout: int = None) -> Di
         auto_approve = os.environ.get('CLAUDE_AUTO_APPROVE', 'true').lower() in ('true', '1', 'yes')
         if auto_approve:
             cmd.insert(2, '--dangerously-skip-permissions')
-            print(f"     Auto-approve: enabled (using --dangerously-skip-permissions)")
+            log.info(f"     Auto-approve: enabled (using --dangerously-skip-permissions)")
         else:
-            print(f"     Auto-approve: disabled (may require user interaction)")
+            log.info(f"     Auto-approve: disabled (may require user interaction)")
 
         # Prepare environment with API key if provided
         env = os.environ.copy()
@@ -249,18 +252,18 @@ def run_claude_init(repo_path: str, claude_path: str, timeout: int = None) -> Di
         if api_key_present:
             api_key_value = env.get('ANTHROPIC_API_KEY', '')
             key_preview = f"{api_key_value[:15]}..." if len(api_key_value) > 15 else api_key_value
-            print(f"     Using ANTHROPIC_API_KEY for authentication")
-            print(f"     API key preview: {key_preview}")
+            log.info(f"     Using ANTHROPIC_API_KEY for authentication")
+            log.info(f"     API key preview: {key_preview}")
         else:
-            print(f"     ⚠️  WARNING: ANTHROPIC_API_KEY not found in environment")
-            print(f"     Available env vars: {', '.join([k for k in env.keys() if 'ANTHROPIC' in k or 'CLAUDE' in k])}")
+            log.warning(f"     ⚠️  WARNING: ANTHROPIC_API_KEY not found in environment")
+            log.warning(f"     Available env vars: {', '.join([k for k in env.keys() if 'ANTHROPIC' in k or 'CLAUDE' in k])}")
 
-        print(f"     Running command: {' '.join(cmd)}")
-        print(f"     Working directory: {repo_path}")
+        log.info(f"     Running command: {' '.join(cmd)}")
+        log.info(f"     Working directory: {repo_path}")
         timeout_display = f"{timeout} seconds" if timeout is not None else "No timeout (will wait indefinitely)"
-        print(f"     Timeout: {timeout_display}")
-        print(f"")
-        print(f"     --- Claude /init output (live) ---")
+        log.info(f"     Timeout: {timeout_display}")
+        log.info(f"")
+        log.info(f"     --- Claude /init output (live) ---")
 
         # Run claude /init command with real-time output
         # Use subprocess.Popen to stream output as it happens
@@ -276,10 +279,9 @@ def run_claude_init(repo_path: str, claude_path: str, timeout: int = None) -> Di
 
         output_lines = []
         try:
-            # Read output line by line and print in real-time
-            # Flush after each line to ensure it appears immediately
+            # Read output line by line and log it as it arrives
             for line in process.stdout:
-                print(f"     {line.rstrip()}", flush=True)  # flush=True forces immediate output
+                log.info(f"     {line.rstrip()}")
                 output_lines.append(line)
 
             # Wait for process to complete
@@ -289,13 +291,13 @@ def run_claude_init(repo_path: str, claude_path: str, timeout: int = None) -> Di
             process.kill()
             process.wait()
             result['error'] = f"Claude /init timed out after {timeout} seconds"
-            print(f"")
-            print(f"     ⏱️  {result['error']}")
+            log.info(f"")
+            log.error(f"     ⏱️  {result['error']}")
             return result
 
-        print(f"     --- End of claude /init output ---")
-        print(f"")
-        print(f"     Process exit code: {return_code}")
+        log.info(f"     --- End of claude /init output ---")
+        log.info(f"")
+        log.info(f"     Process exit code: {return_code}")
 
         # Store output
         result['output'] = ''.join(output_lines)
@@ -311,14 +313,14 @@ def run_claude_init(repo_path: str, claude_path: str, timeout: int = None) -> Di
             # Get file size for confirmation
             file_size = os.path.getsize(claude_md_path)
             action = "reinitialized" if claude_md_existed_before else "created"
-            print(f"     ✅ CLAUDE.md {action} ({file_size} bytes)")
+            log.info(f"     ✅ CLAUDE.md {action} ({file_size} bytes)")
 
         elif return_code == 0:
             # Command succeeded but no file created (might have been approved but not written)
             result['error'] = "Claude /init completed but CLAUDE.md was not created"
-            print(f"     ⚠️  {result['error']}")
+            log.warning(f"     ⚠️  {result['error']}")
             if output_lines:
-                print(f"     Output was: {' '.join(output_lines[:5])[:200]}")
+                log.warning(f"     Output was: {' '.join(output_lines[:5])[:200]}")
 
         else:
             # Command failed - analyze the error
@@ -328,39 +330,39 @@ def run_claude_init(repo_path: str, claude_path: str, timeout: int = None) -> Di
             if "credit balance is too low" in error_output.lower():
                 result['error'] = "Insufficient API credits"
                 result['error_type'] = 'insufficient_credits'
-                print(f"     💳 Claude API credit balance is too low")
-                print(f"     💡 To continue using claude /init:")
-                print(f"        1. Add credits to your Anthropic account at https://console.anthropic.com/")
-                print(f"        2. Or set CLAUDE_INIT_ENABLED=false to skip initialization")
+                log.error(f"     💳 Claude API credit balance is too low")
+                log.info(f"     💡 To continue using claude /init:")
+                log.info(f"        1. Add credits to your Anthropic account at https://console.anthropic.com/")
+                log.info(f"        2. Or set CLAUDE_INIT_ENABLED=false to skip initialization")
 
             elif "authentication" in error_output.lower() or "api key" in error_output.lower():
                 result['error'] = "Authentication failed"
                 result['error_type'] = 'authentication'
-                print(f"     🔑 Claude API authentication failed")
-                print(f"     💡 Check your ANTHROPIC_API_KEY is valid")
+                log.error(f"     🔑 Claude API authentication failed")
+                log.info(f"     💡 Check your ANTHROPIC_API_KEY is valid")
 
             elif "not found" in error_output.lower() or "no such file" in error_output.lower():
                 result['error'] = "Command execution failed"
                 result['error_type'] = 'execution'
-                print(f"     ⚠️  Claude CLI execution failed")
+                log.warning(f"     ⚠️  Claude CLI execution failed")
 
             else:
                 result['error'] = f"Claude /init failed (exit code {return_code})"
                 result['error_type'] = 'unknown'
                 if error_output:
                     result['error'] += f": {error_output[:300]}"
-                print(f"     ❌ {result['error']}")
+                log.error(f"     ❌ {result['error']}")
 
             # Store the full error output for debugging
             result['error_details'] = error_output
 
     except subprocess.TimeoutExpired:
         result['error'] = f"Claude /init timed out after {timeout} seconds"
-        print(f"     ⏱️  {result['error']}")
+        log.error(f"     ⏱️  {result['error']}")
 
     except Exception as e:
         result['error'] = f"Exception running claude /init: {str(e)}"
-        print(f"     ❌ {result['error']}")
+        log.error(f"     ❌ {result['error']}")
 
     return result
 
@@ -391,7 +393,7 @@ def initialize_repository(repo_entry: Dict[str, Any], auto_install: bool = False
     claude_init_enabled = os.environ.get('CLAUDE_INIT_ENABLED', 'true').lower() in ('true', '1', 'yes')
     if not claude_init_enabled:
         result['error'] = "Claude initialization disabled by CLAUDE_INIT_ENABLED setting"
-        print("  ⏭️  Claude /init disabled (CLAUDE_INIT_ENABLED=false)")
+        log.info("  ⏭️  Claude /init disabled (CLAUDE_INIT_ENABLED=false)")
         return result
 
     # Check if claude is available
@@ -400,7 +402,7 @@ def initialize_repository(repo_entry: Dict[str, Any], auto_install: bool = False
 
     # Attempt installation if not available and auto_install is enabled
     if not claude_path and auto_install:
-        print("  🔧 Claude CLI not found, attempting automatic installation...")
+        log.info("  🔧 Claude CLI not found, attempting automatic installation...")
         result['installation_attempted'] = True
 
         # Get installation method from environment variable
@@ -412,15 +414,15 @@ def initialize_repository(repo_entry: Dict[str, Any], auto_install: bool = False
         if install_result['success']:
             claude_path = install_result['claude_path']
             result['claude_available'] = True
-            print(f"  ✅ Claude CLI installed successfully")
+            log.info(f"  ✅ Claude CLI installed successfully")
         else:
             result['error'] = f"Installation failed: {install_result['message']}"
-            print(f"  ❌ {result['error']}")
+            log.error(f"  ❌ {result['error']}")
             return result
 
     if not claude_path:
         result['error'] = "Claude CLI not found on system"
-        print("  ℹ️  Claude CLI not available, skipping initialization")
+        log.info("  ℹ️  Claude CLI not available, skipping initialization")
         return result
 
     # Check if repository has a valid clone path
@@ -432,7 +434,7 @@ def initialize_repository(repo_entry: Dict[str, Any], auto_install: bool = False
     # Only initialize if repo has code
     if not repo_entry.get('has_code', False):
         result['error'] = "Repository has no code files, skipping initialization"
-        print(f"  ⏭️  Skipping claude init (no code detected)")
+        log.info(f"  ⏭️  Skipping claude init (no code detected)")
         return result
 
     # Run claude /init
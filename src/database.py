@@ -9,16 +9,40 @@ from .config import get_database_path
 
 
 def load_database() -> Dict[str, Any]:
-    """Load existing database from YAML file."""
+    """
+    Load existing database from YAML file.
+
+    The returned dictionary also carries an in-memory "_index" mapping each
+    paper_id to its position in "papers". Keys starting with an underscore
+    are never written back by save_database().
+    """
     db_path = get_database_path()
+    database = None
     if db_path.exists():
         with open(db_path, 'r') as f:
-            return yaml.safe_load(f) or {"papers": []}
-    return {"papers": []}
+            database = yaml.safe_load(f)
+    if not database:
+        database = {"papers": []}
+    papers = database.setdefault("papers", [])
+    database["_index"] = {p.get("paper_id"): i for i, p in enumerate(papers)}
+    return database
 
 
 def save_database(database: Dict[str, Any]):
     """Save database to YAML file."""
     db_path = get_database_path()
+    persisted = {k: v for k, v in database.items() if not k.startswith('_')}
     with open(db_path, 'w') as f:
-        yaml.dump(database, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(persisted, f, default_flow_style=False, sort_keys=False)
+
+
+def upsert_paper(database: Dict[str, Any], paper_entry: Dict[str, Any]):
+    """Insert a paper entry, or replace the one with the same paper_id, keeping "_index" in sync."""
+    papers = database.setdefault("papers", [])
+    index = database.setdefault("_index", {})
+    paper_id = paper_entry.get("paper_id")
+    if paper_id in index:
+        papers[index[paper_id]] = paper_entry
+    else:
+        index[paper_id] = len(papers)
+        papers.append(paper_entry)
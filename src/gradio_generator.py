@@ -2,13 +2,16 @@
 Gradio app generation using Claude CLI.
 """
 
+import asyncio
+import logging
 import os
 import subprocess
-import asyncio
 from typing import Dict, Any, Optional
 from pathlib import Path
 from datetime import datetime
 
+log = logging.getLogger(__name__)
+
 
 async def run_claude_command_async(
     claude_path: str,
@@ -56,7 +59,7 @@ async def run_claude_command_async(
         # Prepare environment
         env = os.environ.copy()
 
-        print(f"     Running: {' '.join(cmd[:3])} '{prompt[:50]}...'")
+        log.info(f"     Running: {' '.join(cmd[:3])} '{prompt[:50]}...'")
 
         # Run command asynchronously
         process = await asyncio.create_subprocess_exec(
@@ -130,14 +133,14 @@ async def generate_gradio_app_async(
     repo_url = repo_entry.get('url', 'Unknown')
     languages = repo_entry.get('languages', [])
 
-    print(f"\n  🎨 Generating Gradio app for: {repo_url}")
-    print(f"     Languages: {', '.join(languages) if languages else 'Unknown'}")
+    log.info(f"\n  🎨 Generating Gradio app for: {repo_url}")
+    log.info(f"     Languages: {', '.join(languages) if languages else 'Unknown'}")
 
     result['attempted'] = True
 
     try:
         # Step 1: Add HuggingFace YAML header to README.md
-        print(f"  📝 Step 1: Adding HuggingFace YAML header to README.md...")
+        log.info(f"  📝 Step 1: Adding HuggingFace YAML header to README.md...")
 
         readme_prompt = """Please add a HuggingFace Spaces YAML header to the README.md file.
 
@@ -182,7 +185,7 @@ Please proceed with adding this header now."""
 
         if not readme_result['success']:
             result['error'] = f"Failed to update README.md: {readme_result['error']}"
-            print(f"     ❌ {result['error']}")
+            log.error(f"     ❌ {result['error']}")
             return result
 
         # Check if README.md was created/updated
@@ -190,16 +193,16 @@ Please proceed with adding this header now."""
         if os.path.isfile(readme_path):
             result['readme_updated'] = True
             result['readme_path'] = readme_path
-            print(f"     ✅ README.md updated with HuggingFace header")
+            log.info(f"     ✅ README.md updated with HuggingFace header")
         else:
-            print(f"     ⚠️  README.md not found after update")
+            log.warning(f"     ⚠️  README.md not found after update")
 
         # Extract session ID if available (for continuing conversation)
         # Note: This would require parsing Claude's output or using session management
         # For now, we'll make separate calls
 
         # Step 2: Generate Gradio app
-        print(f"  🎨 Step 2: Generating Gradio app (app.py)...")
+        log.info(f"  🎨 Step 2: Generating Gradio app (app.py)...")
 
         app_prompt = """Please create a Gradio app (app.py) that demonstrates this project.
 
@@ -744,7 +747,7 @@ Please proceed with creating the Gradio app and requirements.txt now."""
 
         if not app_result['success']:
             result['error'] = f"Failed to generate app.py: {app_result['error']}"
-            print(f"     ❌ {result['error']}")
+            log.error(f"     ❌ {result['error']}")
             return result
 
         # Check if app.py was created
@@ -753,27 +756,27 @@ Please proceed with creating the Gradio app and requirements.txt now."""
             result['app_created'] = True
             result['app_path'] = app_path
             file_size = os.path.getsize(app_path)
-            print(f"     ✅ app.py created ({file_size} bytes)")
+            log.info(f"     ✅ app.py created ({file_size} bytes)")
 
             # Show first few lines
             with open(app_path, 'r') as f:
                 first_lines = ''.join(f.readlines()[:5])
-            print(f"     Preview:\n{first_lines}")
+            log.info(f"     Preview:\n{first_lines}")
         else:
             result['error'] = "app.py was not created"
-            print(f"     ❌ {result['error']}")
+            log.error(f"     ❌ {result['error']}")
             return result
 
         # Success if both files were created/updated
         if result['readme_updated'] and result['app_created']:
             result['success'] = True
-            print(f"  ✅ Gradio app generation complete!")
+            log.info(f"  ✅ Gradio app generation complete!")
         else:
             result['error'] = "Partial success - some files missing"
 
     except Exception as e:
         result['error'] = f"Exception during generation: {str(e)}"
-        print(f"  ❌ {result['error']}")
+        log.error(f"  ❌ {result['error']}")
 
     return result
 
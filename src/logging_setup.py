@@ -0,0 +1,78 @@
+"""
+Logging configuration for CheatCode.
+
+Log records from the src package are handed to a queue and written to
+stderr by a background listener thread, so pipeline code never blocks on
+console I/O. Until setup_logging() runs, records are written to stderr
+directly by a fallback handler installed when the package is imported.
+"""
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+_listener: Optional[QueueListener] = None
+
+
+class _FallbackHandler(logging.Handler):
+    """Writes records to stderr, but only while no root handler is configured."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if logging.getLogger().handlers:
+            return  # The application configured logging; let the record propagate instead
+        try:
+            sys.stderr.write(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+
+
+_fallback_handler = _FallbackHandler()
+_fallback_handler.setFormatter(logging.Formatter("%(message)s"))
+
+
+def install_fallback_handler() -> None:
+    """
+    Make the src package's INFO output visible without setup_logging().
+
+    Scripts that import src modules directly still see pipeline progress on
+    stderr. Once the application configures root handlers, or calls
+    setup_logging(), the fallback stays silent.
+    """
+    logger = logging.getLogger("src")
+    if logger.level == logging.NOTSET:
+        logger.setLevel(logging.INFO)
+    if _fallback_handler not in logger.handlers:
+        logger.addHandler(_fallback_handler)
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """
+    Route the src package's log records through a queue to stderr.
+
+    Messages are emitted verbatim (no level or timestamp prefix) to keep the
+    emoji-prefixed console output. Calling this more than once is a no-op.
+
+    Args:
+        level: Minimum level to emit.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.Queue = queue.Queue(-1)
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    logger = logging.getLogger("src")
+    logger.setLevel(level)
+    logger.removeHandler(_fallback_handler)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
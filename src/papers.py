@@ -3,20 +3,29 @@ Paper fetching and link extraction operations.
 """
 
 import json
+import logging
 import re
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Iterable, Optional, Set
 from datetime import datetime
+from urllib.parse import urljoin
 from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from huggingface_hub import get_session, InferenceClient
 from huggingface_hub.utils import hf_raise_for_status
 
 from .status import ProcessingStatus, StepStatus, init_paper_entry, update_step_status
-from .repos import clone_repository
+from .repos import clone_repositories
 from .database import save_database
 from .claude_init import check_claude_available, initialize_repository
 from .gradio_generator import generate_gradio_app
 from .config import get_claude_auto_install
 
+log = logging.getLogger(__name__)
+
+# URLs in free text, and trailing punctuation that gets caught at the end of one
+_URL_RE = re.compile(r'https?://[^\s<>"{}\\|^`\[\]]+[^\s<>"{}\\|^`\[\].,;!?)]')
+_TRAILING_PUNCT_RE = re.compile(r'[.,;:!?)}\]]+$')
+
 
 def fetch_daily_papers(date: str = None) -> List[Dict[str, Any]]:
     """
@@ -41,7 +50,7 @@ def fetch_daily_papers(date: str = None) -> List[Dict[str, Any]]:
         hf_raise_for_status(response)
         return response.json()
     except Exception as e:
-        print(f"Error fetching papers: {e}")
+        log.error(f"Error fetching papers: {e}")
         return []
 
 
@@ -62,7 +71,7 @@ def fetch_paper_page(paper_id: str) -> Optional[str]:
         hf_raise_for_status(response)
         return response.text
     except Exception as e:
-        print(f"Error fetching paper page {paper_id}: {e}")
+        log.error(f"Error fetching paper page {paper_id}: {e}")
         return None
 
 
@@ -87,7 +96,7 @@ def extract_links_from_html(
     Returns:
         Dictionary containing extracted and categorized links.
     """
-    print(f"🔍 Parsing HTML content ({len(html_content)} characters)")
+    log.info(f"🔍 Parsing HTML content ({len(html_content)} characters)")
 
     try:
         # Parse HTML
@@ -105,32 +114,88 @@ def extract_links_from_html(
                 all_links.add(f"https://huggingface.co{href}")
 
         # 2. Extract from text content (for links in abstracts/summaries)
-        # Common pattern: URLs in plain text
-        url_pattern = r'https?://[^\s<>"{}\\|^`\[\]]+[^\s<>"{}\\|^`\[\].,;!?)]'
         text_content = soup.get_text()
-        for match in re.finditer(url_pattern, text_content):
-            url = match.group(0)
+        for match in _URL_RE.finditer(text_content):
             # Clean up any trailing characters that got caught
-            url = re.sub(r'[.,;:!?)}\]]+$', '', url)
-            all_links.add(url)
+            all_links.add(_TRAILING_PUNCT_RE.sub('', match.group(0)))
 
         # 3. Extract from JSON data embedded in the page (like data-props)
         for script_tag in soup.find_all('script'):
             if script_tag.string:
-                for match in re.finditer(url_pattern, script_tag.string):
-                    url = match.group(0)
-                    url = re.sub(r'[.,;:!?)}\]]+$', '', url)
-                    all_links.add(url)
+                for match in _URL_RE.finditer(script_tag.string):
+                    all_links.add(_TRAILING_PUNCT_RE.sub('', match.group(0)))
 
         # Also check data attributes
         for tag in soup.find_all(attrs={'data-props': True}):
             data_props = tag.get('data-props', '')
-            for match in re.finditer(url_pattern, data_props):
-                url = match.group(0)
-                url = re.sub(r'[.,;:!?)}\]]+$', '', url)
-                all_links.add(url)
+            for match in _URL_RE.finditer(data_props):
+                all_links.add(_TRAILING_PUNCT_RE.sub('', match.group(0)))
+
+        return extract_links_from_urls(paper_id, paper_title, all_links, hf_token)
+
+    except Exception as e:
+        log.exception(f"❌ Error extracting links from HTML for {paper_id}: {e}")
+        return _link_extraction_error(paper_id, paper_title, e)
+
+
+def extract_page_urls(html_content: str, base_url: str) -> List[str]:
+    """
+    Collect every absolute URL on an HTML page.
+
+    Covers the same sources as extract_links_from_html(): <a href> anchors
+    (resolved against the page URL), URLs in the visible text, in inline
+    scripts and in data-props attributes. Uses selectolax's C-backed Lexbor
+    parser, which is much faster than building a BeautifulSoup tree.
+
+    Args:
+        html_content: HTML content of the page.
+        base_url: URL of the page, used to resolve relative links.
+
+    Returns:
+        List of absolute http(s) URLs found on the page.
+    """
+    tree = LexborHTMLParser(html_content)
+    urls = []
+    for a_tag in tree.css('a[href]'):
+        href = a_tag.attributes.get('href')
+        if not href:
+            continue
+        url = urljoin(base_url, href.strip())
+        if url.startswith(('http://', 'https://')):
+            urls.append(url)
+
+    # Plain-text URLs, e.g. in abstracts, plus those embedded in scripts and data-props JSON
+    texts = [tree.body.text(separator=' ')] if tree.body is not None else []
+    texts.extend(script.text() for script in tree.css('script'))
+    texts.extend(tag.attributes.get('data-props') or '' for tag in tree.css('[data-props]'))
+    for text in texts:
+        for match in _URL_RE.finditer(text):
+            urls.append(_TRAILING_PUNCT_RE.sub('', match.group(0)))
+    return urls
+
+
+def extract_links_from_urls(
+    paper_id: str,
+    paper_title: str,
+    urls: Iterable[str],
+    hf_token: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Categorize an already-collected list of URLs.
+
+    Args:
+        paper_id: ArXiv ID of the paper.
+        paper_title: Title of the paper.
+        urls: Absolute URLs found on the page.
+        hf_token: Not used, kept for API compatibility.
 
-        print(f"   Found {len(all_links)} total unique URLs")
+    Returns:
+        Dictionary containing extracted and categorized links.
+    """
+    try:
+        all_links: Set[str] = set(urls)
+
+        log.info(f"   Found {len(all_links)} total unique URLs")
 
         # Categorize links
         categorized = {
@@ -147,43 +212,43 @@ def extract_links_from_html(
             # Code repositories
             if any(domain in url_lower for domain in ['github.com', 'gitlab.com', 'bitbucket.org', 'git.io']):
                 categorized["code_repositories"].append(url)
-                print(f"   ✓ Code repo: {url}")
+                log.info(f"   ✓ Code repo: {url}")
 
             # Model weights
             elif 'huggingface.co' in url_lower and any(path in url_lower for path in ['/models/', '/model/']):
                 categorized["model_weights"].append(url)
-                print(f"   ✓ Model: {url}")
+                log.info(f"   ✓ Model: {url}")
 
             # Datasets
             elif 'huggingface.co' in url_lower and '/datasets/' in url_lower:
                 categorized["datasets"].append(url)
-                print(f"   ✓ Dataset: {url}")
+                log.info(f"   ✓ Dataset: {url}")
 
             # Demo links
             elif 'huggingface.co' in url_lower and '/spaces/' in url_lower:
                 categorized["demo_links"].append(url)
-                print(f"   ✓ Demo: {url}")
+                log.info(f"   ✓ Demo: {url}")
             elif any(domain in url_lower for domain in ['colab.research.google.com', 'kaggle.com/code', 'replicate.com']):
                 categorized["demo_links"].append(url)
-                print(f"   ✓ Demo: {url}")
+                log.info(f"   ✓ Demo: {url}")
 
             # Paper links
             elif any(domain in url_lower for domain in ['arxiv.org', 'aclweb.org', 'openreview.net', 'proceedings.mlr.press']):
                 categorized["paper_links"].append(url)
-                print(f"   ✓ Paper: {url}")
+                log.info(f"   ✓ Paper: {url}")
             elif url_lower.endswith('.pdf'):
                 categorized["paper_links"].append(url)
-                print(f"   ✓ Paper PDF: {url}")
+                log.info(f"   ✓ Paper PDF: {url}")
 
         # Print summary
         total_categorized = sum(len(v) for v in categorized.values())
-        print(f"📊 Categorization summary:")
-        print(f"   Code repositories: {len(categorized['code_repositories'])}")
-        print(f"   Model weights: {len(categorized['model_weights'])}")
-        print(f"   Datasets: {len(categorized['datasets'])}")
-        print(f"   Demo links: {len(categorized['demo_links'])}")
-        print(f"   Paper links: {len(categorized['paper_links'])}")
-        print(f"   Total categorized: {total_categorized}/{len(all_links)}")
+        log.info(f"📊 Categorization summary:")
+        log.info(f"   Code repositories: {len(categorized['code_repositories'])}")
+        log.info(f"   Model weights: {len(categorized['model_weights'])}")
+        log.info(f"   Datasets: {len(categorized['datasets'])}")
+        log.info(f"   Demo links: {len(categorized['demo_links'])}")
+        log.info(f"   Paper links: {len(categorized['paper_links'])}")
+        log.info(f"   Total categorized: {total_categorized}/{len(all_links)}")
 
         return {
             "paper_id": paper_id,
@@ -195,24 +260,27 @@ def extract_links_from_html(
         }
 
     except Exception as e:
-        print(f"❌ Error extracting links from HTML for {paper_id}: {e}")
-        import traceback
-        traceback.print_exc()
-        return {
-            "paper_id": paper_id,
-            "title": paper_title,
-            "extracted_at": datetime.now().isoformat(),
-            "error": str(e),
-            "links": {
-                "code_repositories": [],
-                "model_weights": [],
-                "datasets": [],
-                "demo_links": [],
-                "paper_links": []
-            },
-            "total_links_found": 0,
-            "total_links_categorized": 0
-        }
+        log.error(f"❌ Error categorizing links for {paper_id}: {e}")
+        return _link_extraction_error(paper_id, paper_title, e)
+
+
+def _link_extraction_error(paper_id: str, paper_title: str, error: Exception) -> Dict[str, Any]:
+    """Build the result returned when link extraction fails."""
+    return {
+        "paper_id": paper_id,
+        "title": paper_title,
+        "extracted_at": datetime.now().isoformat(),
+        "error": str(error),
+        "links": {
+            "code_repositories": [],
+            "model_weights": [],
+            "datasets": [],
+            "demo_links": [],
+            "paper_links": []
+        },
+        "total_links_found": 0,
+        "total_links_categorized": 0
+    }
 
 
 def extract_links_with_llm(
@@ -287,7 +355,7 @@ HTML Content (truncated to first 8000 characters):
         }
 
     except Exception as e:
-        print(f"Error extracting links with LLM for {paper_id}: {e}")
+        log.error(f"Error extracting links with LLM for {paper_id}: {e}")
         return {
             "paper_id": paper_id,
             "title": paper_title,
@@ -318,14 +386,14 @@ def process_repositories(paper_entry: Dict[str, Any], database: Dict[str, Any])
     code_repos = paper_entry.get('links', {}).get('code_repositories', [])
 
     if not code_repos:
-        print(f"   No code repositories found for {paper_id}")
+        log.info(f"   No code repositories found for {paper_id}")
         update_step_status(paper_entry, 'repo_analysis', StepStatus.SKIPPED)
         paper_entry['processing_steps']['repo_analysis']['repos_found'] = 0
         paper_entry['processing_steps']['repo_analysis']['repos_cloned'] = 0
         save_database(database)
         return 0
 
-    print(f"\n📦 Found {len(code_repos)} code repositories")
+    log.info(f"\n📦 Found {len(code_repos)} code repositories")
     paper_entry['processing_status'] = ProcessingStatus.ANALYZING_REPOS
     update_step_status(paper_entry, 'repo_analysis', StepStatus.IN_PROGRESS)
     paper_entry['processing_steps']['repo_analysis']['repos_found'] = len(code_repos)
@@ -333,6 +401,7 @@ def process_repositories(paper_entry: Dict[str, Any], database: Dict[str, Any])
     repos_cloned = 0
     paper_entry['repositories'] = paper_entry.get('repositories', [])
 
+    repos_to_clone = []
     for repo_url in code_repos:
         # Check if repo already cloned
         existing_repo = None
@@ -342,34 +411,42 @@ def process_repositories(paper_entry: Dict[str, Any], database: Dict[str, Any])
                 break
 
         if existing_repo and existing_repo.get('status') == 'cloned':
-            print(f"   ⏭️  Repo already cloned: {repo_url}")
+            log.info(f"   ⏭️  Repo already cloned: {repo_url}")
             repos_cloned += 1
             continue
 
-        # Clone the repository
-        clone_result = clone_repository(repo_url, paper_id)
+        repos_to_clone.append(repo_url)
 
-        if existing_repo:
-            # Update existing entry
-            for i, r in enumerate(paper_entry['repositories']):
-                if r.get('url') == repo_url:
-                    paper_entry['repositories'][i] = clone_result
-                    break
+    def record_clone(job_index: int, clone_result: Dict[str, Any]):
+        nonlocal repos_cloned
+        repo_url = repos_to_clone[job_index]
+        for i, r in enumerate(paper_entry['repositories']):
+            if r.get('url') == repo_url:
+                # Update existing entry
+                paper_entry['repositories'][i] = clone_result
+                break
         else:
             paper_entry['repositories'].append(clone_result)
 
         if clone_result['status'] == 'cloned':
             repos_cloned += 1
+            paper_entry['processing_steps']['repo_analysis']['repos_cloned'] = repos_cloned
 
-        # Save after each repo clone
+        # Save after each repo so finished clones survive a crash mid-paper
         save_database(database)
 
+    # Clone the remaining repositories in parallel, recording each as it finishes
+    clone_repositories(
+        [(repo_url, paper_id) for repo_url in repos_to_clone],
+        on_result=record_clone
+    )
+
     paper_entry['processing_steps']['repo_analysis']['repos_cloned'] = repos_cloned
     update_step_status(paper_entry, 'repo_analysis', StepStatus.COMPLETED)
     paper_entry['processing_status'] = ProcessingStatus.REPOS_ANALYZED
 
     save_database(database)
-    print(f"✅ Repository analysis complete: {repos_cloned}/{len(code_repos)} cloned")
+    log.info(f"✅ Repository analysis complete: {repos_cloned}/{len(code_repos)} cloned")
 
     return repos_cloned
 
@@ -392,7 +469,7 @@ def process_claude_initialization(paper_entry: Dict[str, Any], database: Dict[st
     cloned_repos = [r for r in repositories if r.get('status') == 'cloned']
 
     if not cloned_repos:
-        print(f"   No cloned repositories found for {paper_id}")
+        log.info(f"   No cloned repositories found for {paper_id}")
         update_step_status(paper_entry, 'claude_init', StepStatus.SKIPPED)
         paper_entry['processing_steps']['claude_init']['repos_initialized'] = 0
         save_database(database)
@@ -407,14 +484,14 @@ def process_claude_initialization(paper_entry: Dict[str, Any], database: Dict[st
 
     # Only skip if Claude is not available AND auto-install is disabled
     if not claude_available and not auto_install:
-        print(f"   Claude CLI not available, skipping initialization for {paper_id}")
-        print(f"   (Set CLAUDE_AUTO_INSTALL=true to enable automatic installation)")
+        log.info(f"   Claude CLI not available, skipping initialization for {paper_id}")
+        log.info(f"   (Set CLAUDE_AUTO_INSTALL=true to enable automatic installation)")
         update_step_status(paper_entry, 'claude_init', StepStatus.SKIPPED, "Claude CLI not found")
         paper_entry['processing_steps']['claude_init']['repos_initialized'] = 0
         save_database(database)
         return 0
 
-    print(f"\n🤖 Initializing {len(cloned_repos)} repositories with claude /init")
+    log.info(f"\n🤖 Initializing {len(cloned_repos)} repositories with claude /init")
     paper_entry['processing_status'] = ProcessingStatus.INITIALIZING_CLAUDE
     update_step_status(paper_entry, 'claude_init', StepStatus.IN_PROGRESS)
 
@@ -431,12 +508,12 @@ def process_claude_initialization(paper_entry: Dict[str, Any], database: Dict[st
 
         # Check if already initialized
         if repo_entry['claude_init'].get('success'):
-            print(f"   ⏭️  Already initialized: {repo_entry.get('url')}")
+            log.info(f"   ⏭️  Already initialized: {repo_entry.get('url')}")
             repos_initialized += 1
             continue
 
         # Run claude initialization
-        print(f"\n  📂 Repository: {repo_entry.get('url')}")
+        log.info(f"\n  📂 Repository: {repo_entry.get('url')}")
         init_result = initialize_repository(repo_entry, auto_install=auto_install)
 
         # Update repo entry with initialization results
@@ -461,7 +538,7 @@ def process_claude_initialization(paper_entry: Dict[str, Any], database: Dict[st
     paper_entry['processing_status'] = ProcessingStatus.CLAUDE_INITIALIZED
 
     save_database(database)
-    print(f"✅ Claude initialization complete: {repos_initialized}/{len(cloned_repos)} initialized")
+    log.info(f"✅ Claude initialization complete: {repos_initialized}/{len(cloned_repos)} initialized")
 
     return repos_initialized
 
@@ -487,7 +564,7 @@ def process_gradio_generation(paper_entry: Dict[str, Any], database: Dict[str, A
     ]
 
     if not initialized_repos:
-        print(f"   No initialized repositories found for {paper_id}")
+        log.info(f"   No initialized repositories found for {paper_id}")
         update_step_status(paper_entry, 'gradio_generation', StepStatus.SKIPPED)
         paper_entry['processing_steps']['gradio_generation']['repos_generated'] = 0
         paper_entry['processing_steps']['gradio_generation']['apps_created'] = 0
@@ -497,14 +574,14 @@ def process_gradio_generation(paper_entry: Dict[str, Any], database: Dict[str, A
     # Check if claude is available
     claude_path = check_claude_available()
     if not claude_path:
-        print(f"   Claude CLI not available, skipping Gradio generation for {paper_id}")
+        log.info(f"   Claude CLI not available, skipping Gradio generation for {paper_id}")
         update_step_status(paper_entry, 'gradio_generation', StepStatus.SKIPPED, "Claude CLI not found")
         paper_entry['processing_steps']['gradio_generation']['repos_generated'] = 0
         paper_entry['processing_steps']['gradio_generation']['apps_created'] = 0
         save_database(database)
         return 0
 
-    print(f"\n🎨 Generating Gradio apps for {len(initialized_repos)} repositories")
+    log.info(f"\n🎨 Generating Gradio apps for {len(initialized_repos)} repositories")
     paper_entry['processing_status'] = ProcessingStatus.GENERATING_GRADIO
     update_step_status(paper_entry, 'gradio_generation', StepStatus.IN_PROGRESS)
 
@@ -513,7 +590,7 @@ def process_gradio_generation(paper_entry: Dict[str, Any], database: Dict[str, A
     for repo_entry in repositories:
         # Skip if repo has no code
         if not repo_entry.get('has_code', False):
-            print(f"   ⏭️  Skipping {repo_entry.get('url')} (no code)")
+            log.info(f"   ⏭️  Skipping {repo_entry.get('url')} (no code)")
             continue
 
         # Skip if not initialized with Claude
@@ -526,12 +603,12 @@ def process_gradio_generation(paper_entry: Dict[str, Any], database: Dict[str, A
 
         # Check if already generated
         if repo_entry['gradio_generation'].get('success'):
-            print(f"   ⏭️  Already generated: {repo_entry.get('url')}")
+            log.info(f"   ⏭️  Already generated: {repo_entry.get('url')}")
             apps_generated += 1
             continue
 
         # Generate Gradio app
-        print(f"\n  📂 Repository: {repo_entry.get('url')}")
+        log.info(f"\n  📂 Repository: {repo_entry.get('url')}")
         gen_result = generate_gradio_app(repo_entry, claude_path)
 
         # Update repo entry with generation results
@@ -558,7 +635,7 @@ def process_gradio_generation(paper_entry: Dict[str, Any], database: Dict[str, A
     paper_entry['processing_status'] = ProcessingStatus.GRADIO_GENERATED
 
     save_database(database)
-    print(f"✅ Gradio generation complete: {apps_generated}/{len(initialized_repos)} apps created")
+    log.info(f"✅ Gradio generation complete: {apps_generated}/{len(initialized_repos)} apps created")
 
     return apps_generated
 
@@ -583,11 +660,12 @@ def process_space_upload(paper_entry: Dict[str, Any], database: Dict[str, Any])
     # Validate configuration
     is_valid, error_msg = validate_space_upload_config()
     if not is_valid:
-        print(f"   ⏭️  Space upload disabled: {error_msg}")
+        log.info(f"   ⏭️  Space upload disabled: {error_msg}")
         update_step_status(paper_entry, 'space_upload', StepStatus.SKIPPED, error_msg)
         paper_entry['processing_steps']['space_upload']['spaces_created'] = 0
         paper_entry['processing_steps']['space_upload']['spaces_failed'] = 0
         paper_entry['processing_steps']['space_upload']['space_urls'] = []
+        paper_entry['processing_status'] = ProcessingStatus.COMPLETED
         save_database(database)
         return 0
 
@@ -598,15 +676,16 @@ def process_space_upload(paper_entry: Dict[str, Any], database: Dict[str, Any])
     ]
 
     if not repos_with_apps:
-        print(f"   No repositories with Gradio apps found for {paper_id}")
+        log.info(f"   No repositories with Gradio apps found for {paper_id}")
         update_step_status(paper_entry, 'space_upload', StepStatus.SKIPPED, "No apps to upload")
         paper_entry['processing_steps']['space_upload']['spaces_created'] = 0
         paper_entry['processing_steps']['space_upload']['spaces_failed'] = 0
         paper_entry['processing_steps']['space_upload']['space_urls'] = []
+        paper_entry['processing_status'] = ProcessingStatus.COMPLETED
         save_database(database)
         return 0
 
-    print(f"\n📤 Uploading {len(repos_with_apps)} repositories to HuggingFace Spaces")
+    log.info(f"\n📤 Uploading {len(repos_with_apps)} repositories to HuggingFace Spaces")
     paper_entry['processing_status'] = ProcessingStatus.UPLOADING_SPACES
     update_step_status(paper_entry, 'space_upload', StepStatus.IN_PROGRESS)
 
@@ -644,11 +723,11 @@ def process_space_upload(paper_entry: Dict[str, Any], database: Dict[str, Any])
         paper_entry['processing_status'] = ProcessingStatus.COMPLETED
 
     save_database(database)
-    print(f"✅ Space upload complete: {summary['spaces_created']}/{summary['total_repos']} spaces created")
+    log.info(f"✅ Space upload complete: {summary['spaces_created']}/{summary['total_repos']} spaces created")
 
     if summary['errors']:
-        print(f"   ⚠️  Errors occurred:")
+        log.warning(f"   ⚠️  Errors occurred:")
         for error_info in summary['errors'][:3]:
-            print(f"      - {error_info['repo_url']}: {error_info['error']}")
+            log.warning(f"      - {error_info['repo_url']}: {error_info['error']}")
 
     return summary['spaces_created']
@@ -2,6 +2,7 @@
 Main processing logic for extracting links and analyzing papers.
 """
 
+import logging
 from typing import Dict, Any
 import gradio as gr
 import re
@@ -9,10 +10,12 @@ import hashlib
 from huggingface_hub import get_session
 from huggingface_hub.utils import hf_raise_for_status
 
-from .papers import fetch_daily_papers, fetch_paper_page, extract_links_from_html, process_repositories, process_claude_initialization, process_gradio_generation, process_space_upload
-from .database import load_database, save_database
+from .papers import fetch_daily_papers, fetch_paper_page, extract_links_from_html, extract_page_urls, extract_links_from_urls, process_repositories, process_claude_initialization, process_gradio_generation, process_space_upload
+from .database import load_database, save_database, upsert_paper
 from .status import ProcessingStatus, StepStatus, init_paper_entry, update_step_status
 
+log = logging.getLogger(__name__)
+
 
 def extract_and_save_links(
     date_filter: str = None,
@@ -39,9 +42,20 @@ def extract_and_save_links(
     if not papers:
         return "No papers found to process."
 
+    # Drop duplicate feed entries so each paper is processed at most once
+    seen_ids = set()
+    unique_papers = []
+    for paper in papers:
+        paper_id = paper.get('paper', {}).get('id')
+        if paper_id in seen_ids:
+            continue
+        seen_ids.add(paper_id)
+        unique_papers.append(paper)
+    papers = unique_papers
+
     # Load existing database
     database = load_database()
-    existing_papers = {p.get("paper_id"): p for p in database.get("papers", [])}
+    papers_index = database["_index"]
 
     processed = 0
     skipped = 0
@@ -49,9 +63,9 @@ def extract_and_save_links(
     repos_cloned = 0
     skipped_papers = []
 
-    print(f"\n📊 Database Status: {len(existing_papers)} papers already in database")
-    print(f"📋 Found {len(papers)} papers to process")
-    print(f"🔧 Repository cloning: {'enabled' if clone_repos else 'disabled'}")
+    log.info(f"\n📊 Database Status: {len(papers_index)} papers already in database")
+    log.info(f"📋 Found {len(papers)} papers to process")
+    log.info(f"🔧 Repository cloning: {'enabled' if clone_repos else 'disabled'}")
 
     for idx, paper in enumerate(papers):
         paper_id = paper.get('paper', {}).get('id', 'N/A')
@@ -60,8 +74,15 @@ def extract_and_save_links(
         progress((idx + 1) / len(papers), desc=f"Processing {paper_id}...")
 
         # Check if paper exists and what status it has
-        if paper_id in existing_papers:
-            existing_paper = existing_papers[paper_id]
+        if paper_id in papers_index:
+            existing_paper = database['papers'][papers_index[paper_id]]
+
+            # Fully processed papers carry a terminal status, no need to walk the steps
+            if existing_paper.get('processing_status') == ProcessingStatus.COMPLETED:
+                skipped += 1
+                skipped_papers.append(paper_id)
+                log.info(f"⏭️  Skipping {paper_id} (already fully processed)")
+                continue
 
             # Check if link extraction is complete
             link_extraction_status = existing_paper.get('processing_steps', {}).get('link_extraction', {}).get('status')
@@ -74,7 +95,7 @@ def extract_and_save_links(
 
                     # Check if we need to analyze repos
                     if repo_analysis_status not in [StepStatus.COMPLETED, StepStatus.IN_PROGRESS]:
-                        print(f"\n🔍 Analyzing repos for existing paper: {paper_id}")
+                        log.info(f"\n🔍 Analyzing repos for existing paper: {paper_id}")
                         repos_count = process_repositories(existing_paper, database)
                         repos_cloned += repos_count
 
@@ -87,7 +108,7 @@ def extract_and_save_links(
                             process_space_upload(existing_paper, database)
                     # Check if we need to initialize claude (repos already cloned)
                     elif claude_init_status not in [StepStatus.COMPLETED, StepStatus.SKIPPED]:
-                        print(f"\n🤖 Initializing claude for existing paper: {paper_id}")
+                        log.info(f"\n🤖 Initializing claude for existing paper: {paper_id}")
                         process_claude_initialization(existing_paper, database)
                         # Generate Gradio apps after initialization
                         process_gradio_generation(existing_paper, database)
@@ -97,7 +118,7 @@ def extract_and_save_links(
                     else:
                         gradio_gen_status = existing_paper.get('processing_steps', {}).get('gradio_generation', {}).get('status')
                         if gradio_gen_status not in [StepStatus.COMPLETED, StepStatus.SKIPPED]:
-                            print(f"\n🎨 Generating Gradio apps for existing paper: {paper_id}")
+                            log.info(f"\n🎨 Generating Gradio apps for existing paper: {paper_id}")
                             process_gradio_generation(existing_paper, database)
                             # Upload to Spaces after generation
                             process_space_upload(existing_paper, database)
@@ -105,21 +126,21 @@ def extract_and_save_links(
                             # Check if we need to upload to Spaces (apps already generated)
                             space_upload_status = existing_paper.get('processing_steps', {}).get('space_upload', {}).get('status')
                             if space_upload_status not in [StepStatus.COMPLETED, StepStatus.SKIPPED]:
-                                print(f"\n📤 Uploading to Spaces for existing paper: {paper_id}")
+                                log.info(f"\n📤 Uploading to Spaces for existing paper: {paper_id}")
                                 process_space_upload(existing_paper, database)
                             else:
                                 skipped += 1
                                 skipped_papers.append(paper_id)
-                                print(f"⏭️  Skipping {paper_id} (already fully processed)")
+                                log.info(f"⏭️  Skipping {paper_id} (already fully processed)")
                 else:
                     skipped += 1
                     skipped_papers.append(paper_id)
-                    print(f"⏭️  Skipping {paper_id} (links already extracted)")
+                    log.info(f"⏭️  Skipping {paper_id} (links already extracted)")
                 continue
 
         # Initialize new paper entry
-        print(f"\n🔄 Processing new paper: {paper_id}")
-        print(f"   Title: {title}")
+        log.info(f"\n🔄 Processing new paper: {paper_id}")
+        log.info(f"   Title: {title}")
 
         paper_entry = init_paper_entry(paper_id, title)
         paper_entry['processing_status'] = ProcessingStatus.EXTRACTING_LINKS
@@ -132,13 +153,13 @@ def extract_and_save_links(
             errors += 1
             paper_entry['processing_status'] = ProcessingStatus.ERROR
             update_step_status(paper_entry, 'link_extraction', StepStatus.ERROR, "Failed to fetch paper page")
-            database.setdefault("papers", []).append(paper_entry)
+            upsert_paper(database, paper_entry)
             save_database(database)
-            print(f"❌ Error fetching page for {paper_id}")
+            log.error(f"❌ Error fetching page for {paper_id}")
             continue
 
         # Extract links from HTML
-        print(f"🔗 Extracting links from HTML...")
+        log.info(f"🔗 Extracting links from HTML...")
         extracted_links = extract_links_from_html(paper_id, title, html_content, hf_token)
 
         if "error" in extracted_links:
@@ -149,17 +170,10 @@ def extract_and_save_links(
             paper_entry['links'] = extracted_links.get('links', {})
             paper_entry['processing_status'] = ProcessingStatus.LINKS_EXTRACTED
             update_step_status(paper_entry, 'link_extraction', StepStatus.COMPLETED)
-            print(f"✅ Links extracted successfully")
+            log.info(f"✅ Links extracted successfully")
 
         # Save after link extraction
-        if paper_id in existing_papers:
-            # Update existing entry
-            for i, p in enumerate(database['papers']):
-                if p['paper_id'] == paper_id:
-                    database['papers'][i] = paper_entry
-                    break
-        else:
-            database.setdefault("papers", []).append(paper_entry)
+        upsert_paper(database, paper_entry)
 
         save_database(database)
         processed += 1
@@ -235,18 +249,18 @@ def process_manual_url(
     else:
         title = title.strip()
 
-    print(f"\n🔄 Processing manual URL")
-    print(f"   URL: {url}")
-    print(f"   Generated ID: {paper_id}")
-    print(f"   Title: {title}")
+    log.info(f"\n🔄 Processing manual URL")
+    log.info(f"   URL: {url}")
+    log.info(f"   Generated ID: {paper_id}")
+    log.info(f"   Title: {title}")
 
     # Load database
     database = load_database()
-    existing_papers = {p.get("paper_id"): p for p in database.get("papers", [])}
+    papers_index = database["_index"]
 
     # Check if already exists
-    if paper_id in existing_papers:
-        existing_paper = existing_papers[paper_id]
+    if paper_id in papers_index:
+        existing_paper = database['papers'][papers_index[paper_id]]
         link_extraction_status = existing_paper.get('processing_steps', {}).get('link_extraction', {}).get('status')
 
         if link_extraction_status == StepStatus.COMPLETED:
@@ -269,45 +283,46 @@ def process_manual_url(
         response = session.get(url, timeout=30)
         hf_raise_for_status(response)
         html_content = response.text
-        print(f"✅ Successfully fetched URL content ({len(html_content)} chars)")
+        log.info(f"✅ Successfully fetched URL content ({len(html_content)} chars)")
     except Exception as e:
         error_msg = f"Failed to fetch URL: {str(e)}"
-        print(f"❌ {error_msg}")
+        log.error(f"❌ {error_msg}")
         paper_entry['processing_status'] = ProcessingStatus.ERROR
         update_step_status(paper_entry, 'link_extraction', StepStatus.ERROR, error_msg)
-        database.setdefault("papers", []).append(paper_entry)
+        upsert_paper(database, paper_entry)
         save_database(database)
         return f"❌ Error: {error_msg}"
 
     # Step 2: Extract links from HTML
     progress(0.4, desc="Extracting links from page...")
-    print(f"🔗 Extracting links from HTML...")
+    log.info(f"🔗 Extracting links from HTML...")
 
-    extracted_links = extract_links_from_html(paper_id, title, html_content, hf_token)
+    # Parse the page once with the fast parser; fall back to the BeautifulSoup
+    # scan only if it can't handle the page
+    try:
+        page_urls = extract_page_urls(html_content, url)
+        extracted_links = extract_links_from_urls(paper_id, title, page_urls, hf_token)
+    except Exception as e:
+        log.warning(f"⚠️  Could not parse page, falling back to a full-text scan: {e}")
+        extracted_links = extract_links_from_html(paper_id, title, html_content, hf_token)
 
     if "error" in extracted_links:
         error_msg = extracted_links.get("error")
-        print(f"❌ Error extracting links: {error_msg}")
+        log.error(f"❌ Error extracting links: {error_msg}")
         paper_entry['processing_status'] = ProcessingStatus.ERROR
         update_step_status(paper_entry, 'link_extraction', StepStatus.ERROR, error_msg)
     else:
         paper_entry['links'] = extracted_links.get('links', {})
         paper_entry['processing_status'] = ProcessingStatus.LINKS_EXTRACTED
         update_step_status(paper_entry, 'link_extraction', StepStatus.COMPLETED)
-        print(f"✅ Links extracted successfully")
+        log.info(f"✅ Links extracted successfully")
 
         # Count extracted links
         total_links = sum(len(v) for v in paper_entry['links'].values())
-        print(f"   Found {total_links} links across all categories")
+        log.info(f"   Found {total_links} links across all categories")
 
     # Save after link extraction
-    if paper_id in existing_papers:
-        for i, p in enumerate(database['papers']):
-            if p['paper_id'] == paper_id:
-                database['papers'][i] = paper_entry
-                break
-    else:
-        database.setdefault("papers", []).append(paper_entry)
+    upsert_paper(database, paper_entry)
 
     save_database(database)
     progress(0.6, desc="Links extracted, saving...")
@@ -407,13 +422,13 @@ def retry_failed_jobs() -> str:
     Returns:
         Status message describing what was retried
     """
-    print("\n🔄 Checking for failed jobs to retry...")
+    log.info("\n🔄 Checking for failed jobs to retry...")
 
     database = load_database()
     papers = database.get("papers", [])
 
     if not papers:
-        print("   No papers in database")
+        log.info("   No papers in database")
         return "No papers in database"
 
     # Find papers with errors or incomplete steps
@@ -426,30 +441,30 @@ def retry_failed_jobs() -> str:
         # Check if paper has error status
         if processing_status == ProcessingStatus.ERROR:
             failed_papers.append(paper)
-            print(f"   📋 Found failed paper: {paper_id} (status: {processing_status})")
+            log.info(f"   📋 Found failed paper: {paper_id} (status: {processing_status})")
         # Or check for any step with error status
         else:
             for step_name, step_info in steps.items():
                 if isinstance(step_info, dict) and step_info.get('status') == StepStatus.ERROR:
                     failed_papers.append(paper)
-                    print(f"   📋 Found paper with failed step: {paper_id} (step: {step_name})")
+                    log.info(f"   📋 Found paper with failed step: {paper_id} (step: {step_name})")
                     break
 
     if not failed_papers:
-        print("   ✅ No failed jobs found")
+        log.info("   ✅ No failed jobs found")
         return "No failed jobs found"
 
-    print(f"\n🔧 Retrying {len(failed_papers)} failed job(s)...\n")
+    log.info(f"\n🔧 Retrying {len(failed_papers)} failed job(s)...\n")
 
     retried = 0
     for paper_entry in failed_papers:
         paper_id = paper_entry.get("paper_id", "Unknown")
         title = paper_entry.get("title", "No title")
 
-        print(f"\n{'='*60}")
-        print(f"🔄 Retrying paper: {paper_id}")
-        print(f"   Title: {title}")
-        print(f"{'='*60}\n")
+        log.info(f"\n{'='*60}")
+        log.info(f"🔄 Retrying paper: {paper_id}")
+        log.info(f"   Title: {title}")
+        log.info(f"{'='*60}\n")
 
         steps = paper_entry.get("processing_steps", {})
 
@@ -457,31 +472,31 @@ def retry_failed_jobs() -> str:
         # Step 1: Link extraction (usually not the issue, but check)
         link_status = steps.get('link_extraction', {}).get('status')
         if link_status == StepStatus.ERROR:
-            print(f"   ⚠️  Link extraction failed - skipping (manual review needed)")
+            log.warning(f"   ⚠️  Link extraction failed - skipping (manual review needed)")
             continue
 
         # Step 2: Repository analysis
         repo_status = steps.get('repo_analysis', {}).get('status')
         if repo_status == StepStatus.ERROR or repo_status == StepStatus.PENDING:
-            print(f"   🔍 Retrying repository analysis...")
+            log.info(f"   🔍 Retrying repository analysis...")
             process_repositories(paper_entry, database)
 
         # Step 3: Claude initialization
         claude_status = steps.get('claude_init', {}).get('status')
         if claude_status == StepStatus.ERROR or (claude_status == StepStatus.PENDING and repo_status == StepStatus.COMPLETED):
-            print(f"   🤖 Retrying Claude initialization...")
+            log.info(f"   🤖 Retrying Claude initialization...")
             process_claude_initialization(paper_entry, database)
 
         # Step 4: Gradio generation
         gradio_status = steps.get('gradio_generation', {}).get('status')
         if gradio_status == StepStatus.ERROR or (gradio_status == StepStatus.PENDING and claude_status == StepStatus.COMPLETED):
-            print(f"   🎨 Retrying Gradio app generation...")
+            log.info(f"   🎨 Retrying Gradio app generation...")
             process_gradio_generation(paper_entry, database)
 
         # Step 5: Space upload
         space_status = steps.get('space_upload', {}).get('status')
         if space_status == StepStatus.ERROR or (space_status == StepStatus.PENDING and gradio_status == StepStatus.COMPLETED):
-            print(f"   📤 Retrying Space upload...")
+            log.info(f"   📤 Retrying Space upload...")
             process_space_upload(paper_entry, database)
 
         retried += 1
@@ -490,6 +505,6 @@ def retry_failed_jobs() -> str:
     result += f"- Papers retried: {retried}\n"
     result += f"- Total failed found: {len(failed_papers)}\n"
 
-    print(f"\n{result}")
+    log.info(f"\n{result}")
 
     return result
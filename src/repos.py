@@ -2,16 +2,98 @@
 Repository cloning and analysis operations.
 """
 
+import json
+import logging
+import os
 import re
 import subprocess
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Callable, Dict, Any, FrozenSet, Iterator, List, Tuple
 from datetime import datetime
 
 from .config import get_repos_path
 from .status import RepoStatus
 
+log = logging.getLogger(__name__)
+
+# owner/repo from a GitHub URL, ignoring a trailing .git, sub-paths, query and fragment
+_GITHUB_REPO_RE = re.compile(r'github\.com/([^/?#]+)/([^/?#]+?)(?:\.git)?(?:[/?#]|$)')
+
+# Source file extensions that count as code
+CODE_EXTENSIONS = frozenset({
+    '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.cpp', '.c', '.h',
+    '.cs', '.go', '.rs', '.rb', '.php', '.swift', '.kt', '.scala',
+    '.m', '.mm', '.r', '.jl', '.dart', '.vue', '.svelte', '.sh', '.bash',
+    '.ipynb'  # Include Jupyter notebooks
+})
+
+# Language reported for each extension
+LANGUAGE_EXTENSIONS = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.jsx': 'JavaScript',
+    '.tsx': 'TypeScript',
+    '.java': 'Java',
+    '.cpp': 'C++',
+    '.c': 'C',
+    '.h': 'C/C++',
+    '.cs': 'C#',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.rb': 'Ruby',
+    '.php': 'PHP',
+    '.swift': 'Swift',
+    '.kt': 'Kotlin',
+    '.scala': 'Scala',
+    '.m': 'Objective-C',
+    '.r': 'R',
+    '.jl': 'Julia',
+    '.dart': 'Dart',
+    '.vue': 'Vue',
+    '.svelte': 'Svelte',
+    '.sh': 'Shell',
+    '.bash': 'Shell',
+    '.ipynb': 'Python'  # Jupyter notebooks
+}
+
+# Only skip build artifacts and dependencies - keep examples/demos/tests
+SKIP_DIRS = frozenset({
+    'node_modules', '.git', '__pycache__', '.pytest_cache', 'dist',
+    'build', 'venv', 'env', '.env', '.venv', 'site-packages'
+})
+
+# Dependency and cache directories left out of the working tree entirely. Unlike
+# SKIP_DIRS this excludes names like env/ or build/, which real projects use for source
+SPARSE_SKIP_DIRS = frozenset({
+    'node_modules', 'venv', '.venv', 'site-packages', '__pycache__'
+})
+
+_ALL_LANGUAGES = len(set(LANGUAGE_EXTENSIONS.values()))
+
+# go-enry (Linguist port) gives more accurate language detection when installed
+_ENRY_PATH = shutil.which('enry')
+
+# ripgrep lists large trees much faster than a Python-level walk when installed
+_RG_PATH = shutil.which('rg')
+
+# README names checked by the fallback code check
+README_FILES = ('README.md', 'README.rst', 'README.txt', 'README')
+
+# Programming/usage indicators looked for in the README
+README_CODE_INDICATORS = (
+    'python', 'javascript', 'typescript', 'java', 'c++', 'rust', 'go',
+    'install', 'pip install', 'npm install', 'cargo build',
+    'usage', 'quickstart', 'getting started', 'import ', 'from ',
+    'require(', 'def ', 'class ', 'function ', 'const ',
+    'example', 'tutorial', 'api', 'library', 'framework'
+)
+_README_CODE_RE = re.compile('|'.join(map(re.escape, README_CODE_INDICATORS)), re.IGNORECASE)
+
 
 def extract_github_info(url: str) -> Optional[Dict[str, str]]:
     """
@@ -23,20 +105,16 @@ def extract_github_info(url: str) -> Optional[Dict[str, str]]:
     Returns:
         Dict with 'owner', 'repo', and 'full_name' or None if invalid
     """
-    patterns = [
-        r'github\.com/([^/]+)/([^/\.]+)',
-        r'github\.com/([^/]+)/([^/]+)\.git'
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return {
-                'owner': match.group(1),
-                'repo': match.group(2),
-                'full_name': f"{match.group(1)}/{match.group(2)}"
-            }
-    return None
+    match = _GITHUB_REPO_RE.search(url)
+    if not match:
+        return None
+
+    owner, repo = match.group(1), match.group(2)
+    return {
+        'owner': owner,
+        'repo': repo,
+        'full_name': f"{owner}/{repo}"
+    }
 
 
 def clone_repository(repo_url: str, paper_id: str) -> Dict[str, Any]:
@@ -74,232 +152,419 @@ def clone_repository(repo_url: str, paper_id: str) -> Dict[str, Any]:
         # Create parent directories
         paper_dir.mkdir(parents=True, exist_ok=True)
 
-        # Remove existing repo if it exists
-        if repo_dir.exists():
-            shutil.rmtree(repo_dir)
-
-        # Clone the repository (shallow clone for speed)
-        print(f"🔄 Cloning {github_info['full_name']} to {repo_dir}...")
         result['status'] = RepoStatus.CLONING
 
-        subprocess.run(
-            ['git', 'clone', '--depth', '1', repo_url, str(repo_dir)],
-            check=True,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
+        # Reuse an existing clone of the same repository when it can be updated in place
+        if (repo_dir / '.git').is_dir() and _update_existing_clone(repo_dir, repo_url):
+            log.info(f"🔄 Updated existing clone of {github_info['full_name']} in {repo_dir}")
+        else:
+            # Remove existing repo if it exists
+            if repo_dir.exists():
+                shutil.rmtree(repo_dir)
+
+            # Clone the repository (shallow, single-branch, blobless clone for speed)
+            log.info(f"🔄 Cloning {github_info['full_name']} to {repo_dir}...")
+            _run_git(
+                '-c', 'protocol.version=2', 'clone',
+                '--depth=1', '--single-branch', '--no-tags', '--filter=blob:none',
+                '--no-checkout',
+                repo_url, str(repo_dir),
+                timeout=300  # 5 minute timeout
+            )
+            _checkout_without_dependency_dirs(repo_dir)
 
         result['status'] = RepoStatus.CLONED
         result['clone_path'] = str(repo_dir)
         result['cloned_at'] = datetime.now().isoformat()
 
-        # Check if repo has actual code
-        result['has_code'] = check_repo_has_code(repo_dir)
-        result['languages'] = detect_languages(repo_dir)
+        # Check if repo has actual code and which languages it uses
+        has_code, languages = _analyze_cached(str(repo_dir), _analysis_key(repo_dir))
+        result['has_code'] = has_code
+        result['languages'] = list(languages)
 
-        print(f"✅ Successfully cloned {github_info['full_name']}")
-        print(f"   Path: {repo_dir}")
-        print(f"   Has code: {result['has_code']}")
-        print(f"   Languages: {', '.join(result['languages']) if result['languages'] else 'None detected'}")
+        log.info(f"✅ Successfully cloned {github_info['full_name']}")
+        log.info(f"   Path: {repo_dir}")
+        log.info(f"   Has code: {result['has_code']}")
+        log.info(f"   Languages: {', '.join(result['languages']) if result['languages'] else 'None detected'}")
 
     except subprocess.TimeoutExpired:
         result['error'] = "Clone timeout (5 minutes exceeded)"
-        print(f"❌ Clone timeout for {repo_url}")
+        log.error(f"❌ Clone timeout for {repo_url}")
     except subprocess.CalledProcessError as e:
         result['error'] = f"Git clone failed: {e.stderr}"
-        print(f"❌ Clone failed for {repo_url}: {e.stderr}")
+        log.error(f"❌ Clone failed for {repo_url}: {e.stderr}")
     except Exception as e:
         result['error'] = str(e)
-        print(f"❌ Error cloning {repo_url}: {e}")
+        log.error(f"❌ Error cloning {repo_url}: {e}")
 
     return result
 
 
-def check_repo_has_code(repo_path: Path) -> bool:
+def _run_git(*args: str, timeout: int = 60) -> subprocess.CompletedProcess:
+    """Run a git command, raising CalledProcessError on failure."""
+    return subprocess.run(
+        ['git', *args],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        # Fail fast instead of waiting for credentials on private or missing repos
+        env={**os.environ, 'GIT_TERMINAL_PROMPT': '0'}
+    )
+
+
+def _set_sparse_patterns(repo_dir: Path):
     """
-    Check if a repository contains actual source code files.
+    Restrict a clone's working tree to everything except SPARSE_SKIP_DIRS.
 
-    This function checks for programming language files anywhere in the repository,
-    including examples/, demos/, and other subdirectories. It uses a lenient approach
-    and also checks README and .gitattributes for language indicators.
+    Vendored dependencies and caches are never analyzed or uploaded, so a
+    sparse checkout avoids fetching and writing their blobs. If sparse
+    checkout is unavailable (git older than 2.25), the full tree is kept.
 
     Args:
-        repo_path: Path to repository
+        repo_dir: Path to the cloned repository
+    """
+    patterns = ['/*'] + [f'!{name}/' for name in sorted(SPARSE_SKIP_DIRS)]
+    try:
+        _run_git('-C', str(repo_dir), 'sparse-checkout', 'set', '--no-cone', *patterns)
+    except subprocess.CalledProcessError as e:
+        log.warning(f"   ⚠️  Sparse checkout unavailable, checking out full tree: {e.stderr.strip()}")
+
+
+def _checkout_without_dependency_dirs(repo_dir: Path):
+    """
+    Check out a --no-checkout clone, leaving SPARSE_SKIP_DIRS out of the working tree.
+
+    Args:
+        repo_dir: Path to the freshly cloned repository
+    """
+    _set_sparse_patterns(repo_dir)
+    _run_git('-C', str(repo_dir), 'checkout', timeout=300)
+
+
+def _update_existing_clone(repo_dir: Path, repo_url: str) -> bool:
+    """
+    Bring an existing clone up to date with its remote's HEAD.
+
+    The working copy ends up identical to a fresh clone: local changes and
+    untracked files are discarded.
+
+    Args:
+        repo_dir: Path to the existing clone
+        repo_url: URL the clone is expected to track
 
     Returns:
-        True if code files are found
+        True if the clone was updated, False if it must be re-cloned
     """
-    code_extensions = {
-        '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.cpp', '.c', '.h',
-        '.cs', '.go', '.rs', '.rb', '.php', '.swift', '.kt', '.scala',
-        '.m', '.mm', '.r', '.jl', '.dart', '.vue', '.svelte', '.sh', '.bash',
-        '.ipynb'  # Include Jupyter notebooks
-    }
+    try:
+        origin = _run_git('-C', str(repo_dir), 'remote', 'get-url', 'origin').stdout.strip()
+        if origin != repo_url:
+            return False
+
+        _run_git('-C', str(repo_dir), 'fetch', '--depth=1', '--force', 'origin', 'HEAD', timeout=300)
+        # Clones made with older sparse patterns get the current ones
+        _set_sparse_patterns(repo_dir)
+        _run_git('-C', str(repo_dir), 'reset', '--hard', 'FETCH_HEAD')
+        _run_git('-C', str(repo_dir), 'clean', '-ffdx')
+        return True
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+        log.warning(f"   ⚠️  Could not update existing clone, re-cloning: {e}")
+        return False
 
-    # Only skip build artifacts and dependencies - keep examples/demos/tests
-    skip_dirs = {
-        'node_modules', '.git', '__pycache__', '.pytest_cache', 'dist',
-        'build', 'venv', 'env', '.env', '.venv', 'site-packages'
-    }
 
-    # More lenient thresholds
-    MIN_FILE_SIZE = 50   # Minimum bytes (lowered from 100)
-    MIN_CODE_FILES = 1   # Just need 1 code file (lowered from 2)
-    MIN_TOTAL_SIZE = 100 # Minimum total bytes (lowered from 500)
+def clone_repositories(
+    jobs: List[Tuple[str, str]],
+    max_workers: Optional[int] = None,
+    on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Clone several repositories concurrently.
+
+    Each job is handed to clone_repository() on a thread pool; clones are
+    network-bound, so threads scale well. Jobs that resolve to the same clone
+    directory are serialized so they never write into it at the same time.
+
+    Args:
+        jobs: List of (repo_url, paper_id) tuples
+        max_workers: Maximum parallel clones (defaults to 3/4 of the CPUs)
+        on_result: Called as on_result(job_index, result) in the calling thread
+            as each clone finishes, e.g. to save progress incrementally
+
+    Returns:
+        List of clone results, in the same order as jobs
+    """
+    if not jobs:
+        return []
+
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 1) * 3 // 4)
+
+    target_locks: Dict[Tuple[str, str], threading.Lock] = {}
+    job_locks = []
+    for repo_url, paper_id in jobs:
+        github_info = extract_github_info(repo_url)
+        target = (paper_id, github_info['full_name'] if github_info else repo_url)
+        job_locks.append(target_locks.setdefault(target, threading.Lock()))
+
+    def run(job: Tuple[str, str], lock: threading.Lock) -> Dict[str, Any]:
+        with lock:
+            return clone_repository(*job)
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        futures = {
+            executor.submit(run, job, lock): i
+            for i, (job, lock) in enumerate(zip(jobs, job_locks))
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            results[i] = future.result()
+            if on_result is not None:
+                on_result(i, results[i])
+    return results
+
+
+def analyze_repo(repo_path: Path) -> Tuple[bool, List[str]]:
+    """
+    Check for source code and detect languages in a single pass over the repository.
 
+    Scans all code files including examples/, demos/, scripts/, samples/, tests/, etc.
+    Only skips build artifacts and dependencies. Languages are detected from file
+    extensions alone, or by the enry CLI when it is installed. Any code file
+    means the repo has code; otherwise falls back to README and
+    .gitattributes indicators for the code check.
+
+    Args:
+        repo_path: Path to repository
+
+    Returns:
+        Tuple of (has_code, sorted list of detected language names)
+    """
     code_files = []
-    total_code_size = 0
+    detected = set()
 
     try:
-        # First, do a quick check for any code files
-        for file in repo_path.rglob('*'):
-            # Skip if not a file
-            if not file.is_file():
-                continue
-
-            # Skip if not a code extension
-            if file.suffix.lower() not in code_extensions:
-                continue
-
-            # Skip if in excluded directories (build artifacts only)
-            if any(skip_dir in file.parts for skip_dir in skip_dirs):
-                continue
-
-            # Get file size
-            file_size = file.stat().st_size
-
-            # Skip empty files but allow small files
-            if file_size < MIN_FILE_SIZE:
-                continue
-
-            # Count this as a code file
-            code_files.append(file)
-            total_code_size += file_size
-
-        # Check if we found code files
-        has_code = (len(code_files) >= MIN_CODE_FILES and
-                   total_code_size >= MIN_TOTAL_SIZE)
-
-        if has_code:
-            print(f"   ✓ Found {len(code_files)} code file(s) ({total_code_size} bytes)")
-            if code_files:
-                # Show some example files
-                examples = [str(f.relative_to(repo_path)) for f in code_files[:5]]
-                print(f"      Examples: {', '.join(examples)}")
-            return True
-
-        # Fallback: Check README for code/project indicators
-        readme_files = ['README.md', 'README.rst', 'README.txt', 'README']
-        for readme_name in readme_files:
-            readme_path = repo_path / readme_name
-            if readme_path.is_file():
-                try:
-                    content = readme_path.read_text(encoding='utf-8', errors='ignore').lower()
-                    # Look for programming/usage indicators
-                    code_indicators = [
-                        'python', 'javascript', 'typescript', 'java', 'c++', 'rust', 'go',
-                        'install', 'pip install', 'npm install', 'cargo build',
-                        'usage', 'quickstart', 'getting started', 'import ', 'from ',
-                        'require(', 'def ', 'class ', 'function ', 'const ',
-                        'example', 'tutorial', 'api', 'library', 'framework'
-                    ]
-                    if any(indicator in content for indicator in code_indicators):
-                        print(f"   ✓ README indicates this is a code project")
-                        return True
-                except Exception:
-                    pass
-
-        # Final fallback: Check .gitattributes for linguist data
-        gitattributes = repo_path / '.gitattributes'
-        if gitattributes.is_file():
-            try:
-                content = gitattributes.read_text(encoding='utf-8', errors='ignore')
-                if 'linguist-language' in content:
-                    print(f"   ✓ .gitattributes indicates programming language")
-                    return True
-            except Exception:
-                pass
-
-        print(f"   ⚠️  No substantial code detected (found {len(code_files)} file(s), {total_code_size} bytes)")
-        return False
+        # Excluded directories (build artifacts only) are pruned by the walker
+        files = _walk_rg(repo_path, SKIP_DIRS, CODE_EXTENSIONS) if _RG_PATH else None
+        if files is None:
+            files = _walk(repo_path, SKIP_DIRS, CODE_EXTENSIONS)
+
+        # Languages are detected by extension alone, no stat needed
+        for entry, extension in files:
+            code_files.append(entry.path)
+            language = LANGUAGE_EXTENSIONS.get(extension)
+            if language:
+                detected.add(language)
+            # Nothing left to learn once every known language was seen
+            if len(detected) == _ALL_LANGUAGES:
+                break
 
     except Exception as e:
-        print(f"   ⚠️  Error checking repo code: {e}")
+        log.warning(f"   ⚠️  Error analyzing repo: {e}")
         # When in doubt, assume it might have code (be lenient)
-        return True
+        return True, sorted(detected)
 
+    languages = sorted(detected)
+    if _ENRY_PATH:
+        enry_languages = _detect_languages_enry(repo_path)
+        if enry_languages is not None:
+            languages = enry_languages
 
-def detect_languages(repo_path: Path) -> List[str]:
-    """
-    Detect programming languages used in the repository.
+    # Only code files decide has_code (enry just labels languages); without
+    # any, fall back to the README/.gitattributes indicators
+    if code_files:
+        log.info(f"   ✓ Found code file(s) in {len(detected)} language(s)")
+        # Show some example files
+        examples = [os.path.relpath(f, repo_path) for f in code_files[:5]]
+        log.info(f"      Examples: {', '.join(examples)}")
+        return True, languages
+
+    if _has_code_indicators(repo_path):
+        return True, languages
+
+    log.warning(f"   ⚠️  No code detected")
+    return False, languages
 
-    Scans all code files including examples/, scripts/, samples/, tests/, etc.
-    Only skips build artifacts and dependencies.
+
+def _detect_languages_enry(repo_path: Path) -> Optional[List[str]]:
+    """
+    Detect programming languages with the enry CLI.
 
     Args:
         repo_path: Path to repository
 
     Returns:
-        List of detected language names
+        Sorted list of language names, or None if enry failed
     """
-    language_extensions = {
-        '.py': 'Python',
-        '.js': 'JavaScript',
-        '.ts': 'TypeScript',
-        '.jsx': 'JavaScript',
-        '.tsx': 'TypeScript',
-        '.java': 'Java',
-        '.cpp': 'C++',
-        '.c': 'C',
-        '.h': 'C/C++',
-        '.cs': 'C#',
-        '.go': 'Go',
-        '.rs': 'Rust',
-        '.rb': 'Ruby',
-        '.php': 'PHP',
-        '.swift': 'Swift',
-        '.kt': 'Kotlin',
-        '.scala': 'Scala',
-        '.m': 'Objective-C',
-        '.r': 'R',
-        '.jl': 'Julia',
-        '.dart': 'Dart',
-        '.vue': 'Vue',
-        '.svelte': 'Svelte',
-        '.sh': 'Shell',
-        '.bash': 'Shell',
-        '.ipynb': 'Python'  # Jupyter notebooks
-    }
+    try:
+        process = subprocess.run(
+            # -prog leaves out markup and data languages (HTML, CSS, Jupyter, ...)
+            [_ENRY_PATH, '-prog', '-json', str(repo_path)],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        if process.returncode != 0:
+            return None
+        data = json.loads(process.stdout)
+    except (subprocess.TimeoutExpired, OSError, ValueError) as e:
+        log.warning(f"   ⚠️  enry language detection failed: {e}")
+        return None
+
+    # enry prints either {language: ...} or [{"language": ...}, ...] depending on version
+    if isinstance(data, dict):
+        return sorted(data)
+    if isinstance(data, list):
+        return sorted({item['language'] for item in data if isinstance(item, dict) and item.get('language')})
+    return None
 
-    # Only skip build artifacts and dependencies - keep examples/demos/tests/scripts/samples
-    skip_dirs = {
-        'node_modules', '.git', '__pycache__', '.pytest_cache', 'dist',
-        'build', 'venv', 'env', '.env', '.venv', 'site-packages'
-    }
 
-    MIN_FILE_SIZE = 50  # Minimum bytes to be considered (lowered for inclusivity)
+def _analysis_key(repo_dir: Path) -> int:
+    """
+    Return a value that changes whenever the checked-out tree changes.
 
-    detected = set()
-    try:
-        for file in repo_path.rglob('*'):
-            if not file.is_file():
-                continue
+    Uses the mtime of the git index, which is rewritten by every clone,
+    checkout or reset, and falls back to the directory's own mtime.
+    """
+    index_path = repo_dir / '.git' / 'index'
+    target = index_path if index_path.is_file() else repo_dir
+    return target.stat().st_mtime_ns
 
-            if file.suffix.lower() not in language_extensions:
-                continue
 
-            # Skip excluded directories (build artifacts only)
-            if any(skip_dir in file.parts for skip_dir in skip_dirs):
-                continue
+@lru_cache(maxsize=1024)
+def _analyze_cached(repo_dir: str, mtime_ns: int) -> Tuple[bool, Tuple[str, ...]]:
+    """Memoized analyze_repo(), keyed by path and _analysis_key()."""
+    has_code, languages = analyze_repo(Path(repo_dir))
+    return has_code, tuple(languages)
 
-            # Skip very small files
-            if file.stat().st_size < MIN_FILE_SIZE:
-                continue
 
-            detected.add(language_extensions[file.suffix.lower()])
+def _extension(name: str) -> str:
+    """Return the lowercased extension of a file name, like Path.suffix."""
+    dot = name.rfind('.')
+    return name[dot:].lower() if dot > 0 else ''
 
-    except Exception as e:
-        print(f"   ⚠️  Error detecting languages: {e}")
 
-    return sorted(list(detected))
+def _walk(root: Path, skip_dirs: FrozenSet[str], extensions: FrozenSet[str]) -> Iterator[Tuple[os.DirEntry, str]]:
+    """
+    Yield (entry, extension) for files under root whose extension is in extensions.
+
+    Directories named in skip_dirs are pruned before descending into them, and
+    symlinks are never followed. Unreadable directories are skipped.
+
+    Args:
+        root: Directory to walk
+        skip_dirs: Directory names to prune
+        extensions: Lowercased extensions (with leading dot) to yield
+
+    Returns:
+        Iterator of (os.DirEntry, lowercased extension) tuples
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip_dirs:
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        extension = _extension(entry.name)
+                        if extension in extensions:
+                            yield entry, extension
+        except OSError:
+            continue
+
+
+class _ListedFile:
+    """Minimal os.DirEntry stand-in for a path listed by ripgrep."""
+
+    __slots__ = ('path',)
+
+    def __init__(self, path: str):
+        self.path = path
+
+
+def _walk_rg(root: Path, skip_dirs: FrozenSet[str], extensions: FrozenSet[str]) -> Optional[List[Tuple[_ListedFile, str]]]:
+    """
+    List files like _walk(), using ripgrep to enumerate the tree.
+
+    Ignore files are not honored, hidden files are included and symlinks are
+    not followed, matching the Python walker.
+
+    Args:
+        root: Directory to walk
+        skip_dirs: Directory names to prune
+        extensions: Lowercased extensions (with leading dot) to keep
+
+    Returns:
+        List of (entry, lowercased extension) tuples, or None if ripgrep failed
+    """
+    command = [_RG_PATH, '--files', '--null', '--hidden', '--no-ignore', '--no-messages']
+    for name in sorted(skip_dirs):
+        command += ['--glob', f'!{name}/']
+    command.append(str(root))
+
+    try:
+        process = subprocess.run(command, capture_output=True, timeout=60)
+    except (subprocess.TimeoutExpired, OSError) as e:
+        log.warning(f"   ⚠️  ripgrep file listing failed: {e}")
+        return None
+    # Exit code 1 means no files at all; 2 may just be unreadable subdirectories
+    if process.returncode not in (0, 1) and not process.stdout:
+        return None
+
+    files = []
+    for raw in process.stdout.split(b'\0'):
+        if not raw:
+            continue
+        path = os.fsdecode(raw)
+        extension = _extension(os.path.basename(path))
+        if extension in extensions:
+            files.append((_ListedFile(path), extension))
+    return files
+
+
+def _read_prefix(path: Path, limit: int = 8192) -> str:
+    """Read and decode at most the first limit bytes of a file."""
+    with path.open('rb') as fh:
+        return fh.read(limit).decode('utf-8', errors='ignore')
+
+
+def _has_code_indicators(repo_path: Path) -> bool:
+    """
+    Check README and .gitattributes for signs of a code project.
+
+    Only the first few KB of each file are read; the indicators are
+    reliably found near the top.
+
+    Args:
+        repo_path: Path to repository
+
+    Returns:
+        True if either file indicates this is a code project
+    """
+    # Check README for code/project indicators
+    for readme_name in README_FILES:
+        readme_path = repo_path / readme_name
+        if readme_path.is_file():
+            try:
+                content = _read_prefix(readme_path)
+                # Look for programming/usage indicators
+                if _README_CODE_RE.search(content):
+                    log.info(f"   ✓ README indicates this is a code project")
+                    return True
+            except Exception:
+                pass
+
+    # Final fallback: Check .gitattributes for linguist data
+    gitattributes = repo_path / '.gitattributes'
+    if gitattributes.is_file():
+        try:
+            content = _read_prefix(gitattributes)
+            if 'linguist-language' in content:
+                log.info(f"   ✓ .gitattributes indicates programming language")
+                return True
+        except Exception:
+            pass
+
+    return False
@@ -5,19 +5,38 @@ This module handles uploading repositories to HuggingFace Spaces,
 including creating the Space, uploading files, and handling file size limits.
 """
 
+import fnmatch
+import glob
+import importlib.util
+import logging
 import os
+import random
 import re
+import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
-from huggingface_hub import HfApi, create_repo, upload_folder, upload_file, SpaceHardware
+from typing import Dict, Any, FrozenSet, Iterator, List, NamedTuple, Optional, Set, Tuple
+from huggingface_hub import CommitOperationAdd, HfApi, SpaceHardware, constants as hf_constants
 from huggingface_hub.utils import HfHubHTTPError, RepositoryNotFoundError
+from .repos import extract_github_info
+
+log = logging.getLogger(__name__)
 
 
 # File size limits for HuggingFace Spaces
 MAX_FILE_SIZE_MB = 50  # HuggingFace has strict limits on individual file sizes
 MAX_TOTAL_SIZE_MB = 500  # Reasonable limit for total space size
 
+# Repositories above either threshold are sent with upload_large_folder
+LARGE_UPLOAD_SIZE_MB = 50
+LARGE_UPLOAD_FILES = 200
+
+# HTTP statuses worth retrying an upload for (timeouts, rate limiting, server errors)
+TRANSIENT_HTTP_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
 # Files to always exclude from upload
 EXCLUDE_PATTERNS = [
     '**/.git/**',
@@ -42,8 +61,80 @@ EXCLUDE_PATTERNS = [
     '**/venv/**',
     '**/env/**',
     '**/.venv/**',
+    '**/README.md.tmp',  # Left behind if a README swap in upload_to_space() was interrupted
 ]
 
+
+class FileInfo(NamedTuple):
+    """Size record for one uploadable file."""
+    path: str        # '/'-separated path relative to the repository root
+    size_mb: float
+    extension: str   # Lowercased, with leading dot, '' if none
+
+
+def _partition_exclude_patterns(patterns: List[str]) -> Tuple[FrozenSet[str], Tuple[str, ...], FrozenSet[str], Optional[re.Pattern]]:
+    """
+    Split glob patterns into cheap checks plus one regex for the rest.
+
+    Args:
+        patterns: Glob patterns like EXCLUDE_PATTERNS
+
+    Returns:
+        Tuple of (directory names from '**/name/**', suffixes from '**/*.ext',
+        base names from '**/name', compiled regex for any other pattern or None)
+    """
+    def is_plain(text: str) -> bool:
+        return not any(c in text for c in '*?[/')
+
+    dirnames, suffixes, basenames, others = set(), [], set(), []
+    for pattern in patterns:
+        if pattern.startswith('**/') and pattern.endswith('/**') and is_plain(pattern[3:-3]):
+            dirnames.add(pattern[3:-3])
+        elif pattern.startswith('**/*.') and is_plain(pattern[5:]):
+            suffixes.append(pattern[4:])
+        elif pattern.startswith('**/') and is_plain(pattern[3:]):
+            basenames.add(pattern[3:])
+        else:
+            others.append(fnmatch.translate(pattern))
+    regex = re.compile('|'.join(others)) if others else None
+    return frozenset(dirnames), tuple(suffixes), frozenset(basenames), regex
+
+
+# EXCLUDE_PATTERNS precomputed into directory names (pruned while walking), file
+# suffixes and base names, and a regex matched against '/' + the relative path
+EXCLUDE_DIRNAMES, _EXCLUDE_SUFFIXES, _EXCLUDE_BASENAMES, _EXCLUDE_RE = _partition_exclude_patterns(EXCLUDE_PATTERNS)
+
+
+def _hub_ignore_patterns(patterns: List[str]) -> List[str]:
+    """
+    Rewrite '**/' glob patterns into the fnmatch form huggingface_hub applies.
+
+    huggingface_hub fnmatches each pattern against the whole relative path,
+    where '*' already crosses '/', but '**/venv/**' never matches a top-level
+    'venv/...'. Each pattern is therefore emitted both rooted and unrooted.
+
+    Args:
+        patterns: Glob patterns like EXCLUDE_PATTERNS
+
+    Returns:
+        Patterns excluding the same files when passed as ignore_patterns
+    """
+    result = []
+    for pattern in patterns:
+        pattern = pattern.replace('**', '*')
+        if pattern.startswith('*/'):
+            result.append(pattern[2:])
+        result.append(pattern)
+    return list(dict.fromkeys(result))
+
+
+# EXCLUDE_PATTERNS as ignore_patterns for upload_large_folder
+_HUB_IGNORE_PATTERNS = _hub_ignore_patterns(EXCLUDE_PATTERNS)
+
+# Characters not allowed in Space names, and runs of hyphens to collapse
+_SPACE_NAME_INVALID_RE = re.compile(r'[^a-z0-9-]')
+_HYPHEN_RUN_RE = re.compile(r'-+')
+
 # Large binary file extensions to warn about
 BINARY_EXTENSIONS = {
     '.bin', '.safetensors', '.ckpt', '.pt', '.pth', '.h5', '.pb',
@@ -56,6 +147,78 @@ BINARY_EXTENSIONS = {
 }
 
 
+@lru_cache(maxsize=4)
+def _get_api(token: str) -> HfApi:
+    """Return a shared HfApi client for a token, reused across uploads."""
+    return HfApi(token=token)
+
+
+# Uploads currently relying on hf_transfer, and the flag value to restore after the last one
+_hf_transfer_lock = threading.Lock()
+_hf_transfer_users = 0
+_hf_transfer_previous = None
+
+
+def _enable_hf_transfer() -> bool:
+    """
+    Route large file uploads through hf_transfer when it is installed.
+
+    huggingface_hub reads HF_HUB_ENABLE_HF_TRANSFER once at import time, so
+    the flag is set on its constants module directly. Newer huggingface_hub
+    releases dropped the flag (and hf_transfer) in favour of hf_xet, in which
+    case nothing is changed. Every successful call must be paired with
+    _release_hf_transfer().
+
+    Returns:
+        True if hf_transfer is enabled for this upload
+    """
+    global _hf_transfer_users, _hf_transfer_previous
+    if getattr(hf_constants, 'HF_HUB_ENABLE_HF_TRANSFER', None) is None:
+        return False
+    with _hf_transfer_lock:
+        if _hf_transfer_users == 0:
+            if importlib.util.find_spec('hf_transfer') is None:
+                log.info("     ℹ️  hf_transfer not installed, using the default upload client (pip install hf_transfer for faster large uploads)")
+                return False
+            _hf_transfer_previous = hf_constants.HF_HUB_ENABLE_HF_TRANSFER
+            hf_constants.HF_HUB_ENABLE_HF_TRANSFER = True
+        _hf_transfer_users += 1
+    return True
+
+
+def _release_hf_transfer():
+    """Restore the hf_transfer flag once no upload is using it any more."""
+    global _hf_transfer_users
+    with _hf_transfer_lock:
+        _hf_transfer_users -= 1
+        if _hf_transfer_users == 0:
+            hf_constants.HF_HUB_ENABLE_HF_TRANSFER = _hf_transfer_previous
+
+
+def _is_transient_upload_error(error: Exception) -> bool:
+    """
+    Check whether a failed upload is worth retrying.
+
+    HTTP errors are retried only for timeouts, rate limiting and server
+    errors; auth, not-found and validation errors fail immediately.
+
+    Args:
+        error: Exception raised by the upload
+
+    Returns:
+        True if the upload should be retried
+    """
+    if isinstance(error, HfHubHTTPError):
+        response = getattr(error, 'response', None)
+        if response is not None:
+            return response.status_code in TRANSIENT_HTTP_STATUSES
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    # Network errors from the HTTP client don't share a common builtin base class
+    error_msg = str(error).lower()
+    return any(x in error_msg for x in ['timeout', 'timed out', 'connection'])
+
+
 def sanitize_space_name(repo_name: str, owner: str, paper_id: str) -> str:
     """
     Create a sanitized Space name.
@@ -69,8 +232,8 @@ def sanitize_space_name(repo_name: str, owner: str, paper_id: str) -> str:
         Sanitized space name
     """
     # Clean the repo name: lowercase, replace special chars with hyphens
-    clean_name = re.sub(r'[^a-z0-9-]', '-', repo_name.lower())
-    clean_name = re.sub(r'-+', '-', clean_name).strip('-')
+    clean_name = _SPACE_NAME_INVALID_RE.sub('-', repo_name.lower())
+    clean_name = _HYPHEN_RUN_RE.sub('-', clean_name).strip('-')
 
     # Add paper ID suffix for uniqueness (use first 8 chars to keep it short)
     paper_suffix = paper_id.replace('.', '-')[:8]
@@ -89,122 +252,115 @@ def sanitize_space_name(repo_name: str, owner: str, paper_id: str) -> str:
     return space_name
 
 
-def check_file_sizes(repo_path: str) -> Tuple[List[Dict[str, Any]], int, List[str]]:
+def check_file_sizes(
+    repo_path: str,
+    stop_after_mb: Optional[int] = 2 * MAX_TOTAL_SIZE_MB
+) -> Tuple[List[FileInfo], int, List[str]]:
     """
     Check file sizes in repository and identify problematic files.
 
     Args:
         repo_path: Path to repository
+        stop_after_mb: Stop walking once the total exceeds this many MB, since
+            the repository will be rejected anyway (None to always walk everything)
 
     Returns:
-        Tuple of (file_list, total_size_mb, warnings)
+        Tuple of (list of FileInfo records, total_size_mb, warnings)
     """
     repo_path = Path(repo_path)
     files = []
     total_size = 0
     warnings = []
+    stop_after = stop_after_mb * 1024 * 1024 if stop_after_mb is not None else None
 
-    for file_path in repo_path.rglob('*'):
-        if file_path.is_file():
-            # Skip excluded patterns
-            relative_path = file_path.relative_to(repo_path)
-            skip = False
-            for pattern in EXCLUDE_PATTERNS:
-                pattern_clean = pattern.replace('**/', '').replace('/**', '')
-                if pattern_clean in str(relative_path):
-                    skip = True
-                    break
-
-            if skip:
-                continue
-
-            size = file_path.stat().st_size
-            size_mb = size / (1024 * 1024)
-
-            files.append({
-                'path': str(relative_path),
-                'size': size,
-                'size_mb': size_mb
-            })
+    for entry, relative_path in _walk_uploadable(str(repo_path)):
+        size = entry.stat().st_size
+        size_mb = size / (1024 * 1024)
+        name = entry.name
+        dot = name.rfind('.')
+        extension = name[dot:].lower() if dot > 0 else ''
 
-            total_size += size
+        files.append(FileInfo(relative_path, size_mb, extension))
 
-            # Warn about large files
-            if size_mb > MAX_FILE_SIZE_MB:
-                warnings.append(
-                    f"File {relative_path} is {size_mb:.1f}MB (exceeds {MAX_FILE_SIZE_MB}MB limit)"
-                )
+        total_size += size
 
-            # Warn about binary files
-            if file_path.suffix.lower() in BINARY_EXTENSIONS and size_mb > 10:
-                warnings.append(
-                    f"Large binary file {relative_path} ({size_mb:.1f}MB) - may cause upload issues"
-                )
+        # Warn about large files
+        if size_mb > MAX_FILE_SIZE_MB:
+            warnings.append(
+                f"File {relative_path} is {size_mb:.1f}MB (exceeds {MAX_FILE_SIZE_MB}MB limit)"
+            )
+
+        # Warn about binary files
+        if extension in BINARY_EXTENSIONS and size_mb > 10:
+            warnings.append(
+                f"Large binary file {relative_path} ({size_mb:.1f}MB) - may cause upload issues"
+            )
+
+        if stop_after is not None and total_size > stop_after:
+            warnings.append(f"Stopped size check after exceeding {stop_after_mb}MB")
+            break
 
     total_size_mb = int(total_size / (1024 * 1024))
 
     return files, total_size_mb, warnings
 
 
-def filter_uploadable_files(files: List[Dict[str, Any]]) -> List[str]:
+def _quick_reject(top_level: Set[str]) -> Optional[str]:
     """
-    Filter files that can be safely uploaded to HuggingFace Spaces.
+    Reject a clone from its top-level names alone.
 
     Args:
-        files: List of file info dicts
+        top_level: Names of the entries at the root of the clone
 
     Returns:
-        List of file paths to upload
+        Reason the clone can't produce a useful Space, or None if it may
     """
-    uploadable = []
-
-    for file_info in files:
-        # Skip files that are too large
-        if file_info['size_mb'] > MAX_FILE_SIZE_MB:
-            continue
-
-        uploadable.append(file_info['path'])
+    uploadable = [
+        name for name in top_level
+        if name not in EXCLUDE_DIRNAMES and name not in _EXCLUDE_BASENAMES
+        and not name.endswith(_EXCLUDE_SUFFIXES)
+    ]
+    if not uploadable:
+        return "No uploadable files at the top level"
+    return None
 
-    return uploadable
 
-
-def create_space_readme(
-    repo_name: str,
-    repo_url: str,
-    paper_id: str,
-    paper_title: str,
-    languages: List[str],
-    has_app: bool = False
-) -> str:
+def _walk_uploadable(root: str) -> Iterator[Tuple[os.DirEntry, str]]:
     """
-    Create a README.md for the HuggingFace Space.
+    Yield (entry, relative_path) for every file under root not matched by EXCLUDE_PATTERNS.
+
+    Directories in EXCLUDE_DIRNAMES are pruned before descending into them,
+    symlinks are never followed and unreadable directories are skipped.
 
     Args:
-        repo_name: Repository name
-        repo_url: Original GitHub URL
-        paper_id: Paper ID
-        paper_title: Paper title
-        languages: List of programming languages
-        has_app: Whether an app.py was generated
+        root: Directory to walk
 
     Returns:
-        README content
+        Iterator of (os.DirEntry, '/'-separated path relative to root) tuples
     """
-    app_status = "✅ Generated by CheatCode" if has_app else "⚠️ No app.py found"
-
-    # Generate a short description from the paper title (truncate to ~100 chars)
-    short_desc = paper_title[:97] + "..." if len(paper_title) > 100 else paper_title
-
-    # Escape double quotes in strings for YAML safety
-    def yaml_escape(text: str) -> str:
-        """Escape double quotes for YAML string values."""
-        return text.replace('"', '\\"') if text else text
+    stack = ['']
+    while stack:
+        relative_dir = stack.pop()
+        try:
+            with os.scandir(os.path.join(root, relative_dir)) as entries:
+                for entry in entries:
+                    relative_path = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in EXCLUDE_DIRNAMES:
+                            stack.append(relative_path)
+                    elif entry.is_file(follow_symlinks=False):
+                        name = entry.name
+                        if name in _EXCLUDE_BASENAMES or name.endswith(_EXCLUDE_SUFFIXES):
+                            continue
+                        if _EXCLUDE_RE and _EXCLUDE_RE.match('/' + relative_path):
+                            continue
+                        yield entry, relative_path
+        except OSError:
+            continue
 
-    # Prepare YAML-safe values
-    safe_title = yaml_escape(repo_name)
-    safe_short_desc = yaml_escape(short_desc)
 
-    readme = f"""---
+# Space README, filled in by create_space_readme()
+_README_TEMPLATE = """---
 title: "{safe_title}"
 emoji: 🤖
 colorFrom: yellow
@@ -235,7 +391,7 @@ license: mit
 
 ## 🛠️ Repository Information
 
-- **Languages**: {', '.join(languages) if languages else 'Not detected'}
+- **Languages**: {languages}
 - **Gradio App**: {app_status}
 
 ## 🤖 About CheatCode
@@ -250,7 +406,7 @@ an AI-powered tool that:
 
 ## 📝 Usage
 
-{'This Space includes a Gradio app that was automatically generated from the repository code.' if has_app else 'This Space contains the repository code. You may need to add an app.py file to create a demo.'}
+{usage}
 
 ## ⚠️ Disclaimer
 
@@ -262,7 +418,57 @@ additional configuration or dependencies to run properly.
 Please refer to the original repository for licensing information: {repo_url}
 """
 
-    return readme
+_USAGE_WITH_APP = 'This Space includes a Gradio app that was automatically generated from the repository code.'
+_USAGE_WITHOUT_APP = 'This Space contains the repository code. You may need to add an app.py file to create a demo.'
+
+
+def create_space_readme(
+    repo_name: str,
+    repo_url: str,
+    paper_id: str,
+    paper_title: str,
+    languages: List[str],
+    has_app: bool = False
+) -> str:
+    """
+    Create a README.md for the HuggingFace Space.
+
+    Args:
+        repo_name: Repository name
+        repo_url: Original GitHub URL
+        paper_id: Paper ID
+        paper_title: Paper title
+        languages: List of programming languages
+        has_app: Whether an app.py was generated
+
+    Returns:
+        README content
+    """
+    app_status = "✅ Generated by CheatCode" if has_app else "⚠️ No app.py found"
+
+    # Generate a short description from the paper title (truncate to ~100 chars)
+    short_desc = paper_title[:97] + "..." if len(paper_title) > 100 else paper_title
+
+    # Escape double quotes in strings for YAML safety
+    def yaml_escape(text: str) -> str:
+        """Escape double quotes for YAML string values."""
+        return text.replace('"', '\\"') if text else text
+
+    # Prepare YAML-safe values
+    safe_title = yaml_escape(repo_name)
+    safe_short_desc = yaml_escape(short_desc)
+
+    return _README_TEMPLATE.format_map({
+        'safe_title': safe_title,
+        'safe_short_desc': safe_short_desc,
+        'repo_name': repo_name,
+        'paper_id': paper_id,
+        'paper_title': paper_title,
+        'repo_url': repo_url,
+        'languages': ', '.join(languages) if languages else 'Not detected',
+        'app_status': app_status,
+        'usage': _USAGE_WITH_APP if has_app else _USAGE_WITHOUT_APP,
+    })
 
 
 def upload_to_space(
@@ -306,6 +512,7 @@ def upload_to_space(
         'total_size_mb': 0
     }
 
+    hf_transfer_enabled = False
     try:
         # Validate inputs
         clone_path = repo_entry.get('clone_path')
@@ -313,6 +520,14 @@ def upload_to_space(
             result['error'] = "Invalid or missing clone path"
             return result
 
+        # Cheap top-level precheck before walking the whole tree
+        top_level = set(os.listdir(clone_path))
+        reject_reason = _quick_reject(top_level)
+        if reject_reason:
+            result['error'] = reject_reason
+            log.info(f"  ⏭️  Not uploading {clone_path}: {reject_reason}")
+            return result
+
         # Extract repository info
         repo_url = repo_entry.get('url', '')
         repo_match = re.search(r'github\.com/([^/]+)/([^/]+?)(?:\.git)?$', repo_url)
@@ -328,40 +543,48 @@ def upload_to_space(
         space_name = sanitize_space_name(repo_name, owner, paper_id)
         space_id = f"{username}/{space_name}"
 
-        print(f"  📦 Preparing to upload to Space: {space_id}")
-        print(f"     Original repo: {repo_url}")
-        print(f"     Local path: {clone_path}")
+        log.info(f"  📦 Preparing to upload to Space: {space_id}")
+        log.info(f"     Original repo: {repo_url}")
+        log.info(f"     Local path: {clone_path}")
 
         # Check file sizes
-        print(f"     Analyzing files...")
+        log.info(f"     Analyzing files...")
         files, total_size_mb, warnings = check_file_sizes(clone_path)
         result['warnings'] = warnings
         result['total_size_mb'] = total_size_mb
 
         if warnings:
-            print(f"     ⚠️  Found {len(warnings)} warnings:")
+            log.warning(f"     ⚠️  Found {len(warnings)} warnings:")
             for warning in warnings[:5]:  # Show first 5 warnings
-                print(f"        - {warning}")
+                log.warning(f"        - {warning}")
             if len(warnings) > 5:
-                print(f"        ... and {len(warnings) - 5} more")
+                log.warning(f"        ... and {len(warnings) - 5} more")
 
-        print(f"     Total files: {len(files)}, Total size: {total_size_mb}MB")
+        log.info(f"     Total files: {len(files)}, Total size: {total_size_mb}MB")
 
         # Check if total size is too large
         if total_size_mb > MAX_TOTAL_SIZE_MB:
             result['error'] = f"Repository too large ({total_size_mb}MB exceeds {MAX_TOTAL_SIZE_MB}MB limit)"
-            print(f"     ❌ {result['error']}")
+            log.error(f"     ❌ {result['error']}")
             return result
 
+        # Large repos and binary assets upload much faster over hf_transfer's parallel connections
+        has_large_binaries = any(
+            f.size_mb > 10 and f.extension in BINARY_EXTENSIONS
+            for f in files
+        )
+        if total_size_mb > 50 or has_large_binaries:
+            hf_transfer_enabled = _enable_hf_transfer()
+
         # Initialize HuggingFace API
-        api = HfApi(token=hf_token)
+        api = _get_api(hf_token)
 
         # Check if Space already exists
         space_exists = False
         try:
             api.repo_info(repo_id=space_id, repo_type="space")
             space_exists = True
-            print(f"     ℹ️  Space already exists: {space_id}")
+            log.info(f"     ℹ️  Space already exists: {space_id}")
 
             if not force:
                 result['error'] = "Space already exists (use force=True to overwrite)"
@@ -374,202 +597,143 @@ def upload_to_space(
 
         # Create or update Space
         if not space_exists:
-            print(f"     🏗️  Creating Space...")
+            log.info(f"     🏗️  Creating Space...")
             try:
-                create_repo(
+                api.create_repo(
                     repo_id=space_id,
                     repo_type="space",
                     space_sdk="gradio",
                     space_hardware="zerogpu",
-                    private=private,
-                    token=hf_token
+                    private=private
                 )
-                print(f"     ✅ Space created with ZeroGPU hardware")
+                log.info(f"     ✅ Space created with ZeroGPU hardware")
             except Exception as e:
                 result['error'] = f"Failed to create Space: {str(e)}"
-                print(f"     ❌ {result['error']}")
+                log.error(f"     ❌ {result['error']}")
                 return result
         else:
-            print(f"     🔄 Updating existing Space...")
+            log.info(f"     🔄 Updating existing Space...")
 
         # Create README for the Space
         languages = repo_entry.get('languages', [])
-        has_app = os.path.isfile(os.path.join(clone_path, 'app.py'))
+        has_app = 'app.py' in top_level
         readme_content = create_space_readme(
             repo_name, repo_url, paper_id, paper_title, languages, has_app
         )
 
         # Write README to repo
         readme_path = os.path.join(clone_path, 'README.md')
-        readme_existed = os.path.isfile(readme_path)
-
-        # Backup existing README if it exists
-        if readme_existed:
-            backup_path = os.path.join(clone_path, 'README_original.md')
-            if not os.path.exists(backup_path):
-                os.rename(readme_path, backup_path)
-                print(f"     📝 Backed up original README to README_original.md")
-
-        # Write new README
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
-        print(f"     📝 Created Space README.md")
-
-        # Upload folder to Space with staged upload strategy
-        print(f"     ⬆️  Uploading files to Space...")
-        print(f"     This may take several minutes depending on repository size...")
-
-        # Use staged upload for large repositories
-        use_staged_upload = total_size_mb > 50 or len(files) > 300
-
-        if use_staged_upload:
-            print(f"     ℹ️  Using staged upload (core files first, then assets)")
-
-            # Create temporary ignore patterns for each stage
-            # Stage 1: Core source files (exclude large assets)
-            stage1_ignore = EXCLUDE_PATTERNS + [
-                '**/*.onnx', '**/*.pt', '**/*.pth', '**/*.h5', '**/*.pb',  # Model files
-                '**/*.bin', '**/*.weights',  # Weight files
-                '**/*.mp4', '**/*.avi', '**/*.mov', '**/*.mkv',  # Videos
-                '**/*.zip', '**/*.tar', '**/*.tar.gz', '**/*.tgz',  # Archives
-                '**/*.jpg', '**/*.jpeg', '**/*.png', '**/*.gif',  # Images (if > 1MB, filtered later)
-                '**/assets/**', '**/screenshots/**', '**/demo/**', '**/examples/**'
-            ]
-
-            # Stage 2: Large assets only (inverse of stage1)
-            stage2_allow_patterns = [
-                '**/*.onnx', '**/*.pt', '**/*.pth', '**/*.h5', '**/*.pb',
-                '**/*.bin', '**/*.weights',
-                '**/*.mp4', '**/*.avi', '**/*.mov', '**/*.mkv',
-                '**/*.zip', '**/*.tar', '**/*.tar.gz', '**/*.tgz',
-                '**/assets/**', '**/screenshots/**', '**/demo/**', '**/examples/**'
-            ]
-        else:
-            use_staged_upload = False
+        readme_existed = 'README.md' in top_level
 
-        # Retry logic for uploads
-        max_retries = 3
-        retry_delay = 10  # seconds
+        # Write the new README next to the old one first, so a crash never loses either
+        tmp_path = readme_path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(readme_content)
 
-        # Stage 1: Upload core source files
-        for attempt in range(max_retries):
+            # Backup existing README if it exists (hard link, copy where links aren't supported)
+            if readme_existed and 'README_original.md' not in top_level:
+                backup_path = os.path.join(clone_path, 'README_original.md')
+                try:
+                    os.link(readme_path, backup_path)
+                except OSError:
+                    shutil.copyfile(readme_path, backup_path)
+                log.info(f"     📝 Backed up original README to README_original.md")
+
+            # Atomically swap in the new README
+            os.replace(tmp_path, readme_path)
+        finally:
+            # Only still there if the swap failed; don't leave it to be uploaded later
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        log.info(f"     📝 Created Space README.md")
+
+        # Upload folder to Space
+        log.info(f"     ⬆️  Uploading files to Space...")
+        log.info(f"     This may take several minutes depending on repository size...")
+
+        if total_size_mb > LARGE_UPLOAD_SIZE_MB or len(files) > LARGE_UPLOAD_FILES:
+            # Resumable, multi-worker upload that retries failed files by itself
+            log.info(f"     ℹ️  Using large folder upload ({len(files)} files, {total_size_mb}MB)")
             try:
-                if attempt > 0:
-                    print(f"     🔄 Retry attempt {attempt + 1}/{max_retries}...")
-                    time.sleep(retry_delay * attempt)  # Exponential backoff
-
-                if use_staged_upload:
-                    print(f"     📦 Stage 1/2: Uploading core source files...")
-
-                upload_folder(
-                    folder_path=clone_path,
+                api.upload_large_folder(
                     repo_id=space_id,
                     repo_type="space",
-                    token=hf_token,
-                    ignore_patterns=stage1_ignore if use_staged_upload else EXCLUDE_PATTERNS,
-                    commit_message=f"Upload core files for paper {paper_id}" if use_staged_upload else f"Upload repository for paper {paper_id}"
+                    folder_path=clone_path,
+                    # A few globs plus the oversize files; per-file allow patterns
+                    # would be matched against every file, O(files²)
+                    ignore_patterns=_HUB_IGNORE_PATTERNS + [
+                        glob.escape(f.path) for f in files if f.size_mb > MAX_FILE_SIZE_MB
+                    ],
+                    num_workers=min(8, os.cpu_count() or 1),
+                    print_report=False
                 )
+                log.info(f"     ✅ Large folder upload complete!")
+            except Exception as e:
+                result['error'] = f"Upload failed: {str(e)}"
+                log.error(f"     ❌ {result['error']}")
+                return result
+        else:
+            # Commit exactly the files already walked and size-checked above,
+            # plus the READMEs written since
+            upload_paths = dict.fromkeys(f.path for f in files if f.size_mb <= MAX_FILE_SIZE_MB)
+            upload_paths['README.md'] = None
+            if os.path.isfile(os.path.join(clone_path, 'README_original.md')):
+                upload_paths['README_original.md'] = None
+            operations = [
+                CommitOperationAdd(path_in_repo=path, path_or_fileobj=os.path.join(clone_path, path))
+                for path in upload_paths
+            ]
 
-                print(f"     ✅ Stage 1 complete!")
-                break  # Success, exit retry loop
-
-            except (HfHubHTTPError, TimeoutError, ConnectionError, Exception) as e:
-                error_msg = str(e)
-                is_timeout = any(x in error_msg.lower() for x in ['timeout', 'timed out', 'connection'])
-                is_last_attempt = (attempt == max_retries - 1)
-
-                if is_timeout and not is_last_attempt:
-                    print(f"     ⚠️  Upload timed out, will retry...")
-                    continue
-                else:
-                    result['error'] = f"Upload failed (Stage 1): {error_msg}"
-                    print(f"     ❌ {result['error']}")
-                    if 'file is too large' in error_msg.lower():
-                        result['error'] += " (File too large - check warnings)"
-
-                    # Don't return yet if using staged upload - core files might be uploaded
-                    if not use_staged_upload:
-                        return result
-                    break
-
-        # Stage 2: Upload large assets (if using staged upload and stage 1 succeeded)
-        if use_staged_upload and not result.get('error'):
-            print(f"     📦 Stage 2/2: Uploading large assets and media files...")
-            print(f"     ⚠️  This stage may take longer and could timeout - that's okay!")
+            # Retry logic for uploads
+            max_retries = 3
+            retry_delay = 10  # seconds
 
             for attempt in range(max_retries):
                 try:
                     if attempt > 0:
-                        print(f"     🔄 Retry attempt {attempt + 1}/{max_retries}...")
-                        time.sleep(retry_delay * attempt)
-
-                    # Upload only the large asset files
-                    # Find large asset files
-                    asset_files = []
-                    for file_info in files:
-                        file_path = Path(clone_path) / file_info['path']
-                        # Check if file matches asset patterns and size > 1MB
-                        if file_info['size_mb'] > 1:
-                            for pattern in ['.onnx', '.pt', '.pth', '.h5', '.pb', '.bin', '.weights',
-                                          '.mp4', '.avi', '.mov', '.mkv', '.zip', '.tar', '.gz']:
-                                if str(file_info['path']).endswith(pattern):
-                                    asset_files.append(file_info)
-                                    break
-
-                    if asset_files:
-                        print(f"     📊 Found {len(asset_files)} large asset files to upload")
-                        uploaded = 0
-
-                        for asset in asset_files[:10]:  # Limit to first 10 assets to avoid excessive uploads
-                            try:
-                                if asset['size_mb'] <= MAX_FILE_SIZE_MB:  # Only upload if within limits
-                                    print(f"        - Uploading {asset['path']} ({asset['size_mb']:.1f}MB)...")
-                                    upload_file(
-                                        path_or_fileobj=str(Path(clone_path) / asset['path']),
-                                        path_in_repo=asset['path'],
-                                        repo_id=space_id,
-                                        repo_type="space",
-                                        token=hf_token,
-                                        commit_message=f"Add asset: {asset['path']}"
-                                    )
-                                    uploaded += 1
-                                else:
-                                    print(f"        ⏭️  Skipping {asset['path']} (too large: {asset['size_mb']:.1f}MB)")
-                            except Exception as e:
-                                print(f"        ⚠️  Failed to upload {asset['path']}: {str(e)[:100]}")
-
-                        if uploaded > 0:
-                            print(f"     ✅ Stage 2 complete! Uploaded {uploaded}/{len(asset_files)} assets")
-                    else:
-                        print(f"     ℹ️  No large assets to upload in stage 2")
-
-                    break  # Stage 2 done
+                        log.info(f"     🔄 Retry attempt {attempt + 1}/{max_retries}...")
+                        # Jittered exponential backoff, so parallel uploads don't retry in lockstep
+                        time.sleep(min(60, retry_delay * 2 ** (attempt - 1)) * random.uniform(0.5, 1.5))
+
+                    api.create_commit(
+                        repo_id=space_id,
+                        repo_type="space",
+                        operations=operations,
+                        commit_message=f"Upload repository for paper {paper_id}"
+                    )
+                    break  # Success, exit retry loop
 
                 except Exception as e:
                     error_msg = str(e)
                     is_last_attempt = (attempt == max_retries - 1)
 
-                    if not is_last_attempt:
-                        print(f"     ⚠️  Stage 2 failed, will retry...")
+                    if _is_transient_upload_error(e) and not is_last_attempt:
+                        log.warning(f"     ⚠️  Upload failed with a transient error, will retry: {error_msg[:200]}")
                         continue
-                    else:
-                        print(f"     ⚠️  Stage 2 failed (non-critical): {error_msg[:200]}")
-                        # Don't fail the whole upload if stage 2 fails
-                        break
 
-        # Mark as successful if stage 1 completed
+                    result['error'] = f"Upload failed: {error_msg}"
+                    if 'file is too large' in error_msg.lower():
+                        result['error'] += " (File too large - check warnings)"
+                    log.error(f"     ❌ {result['error']}")
+                    return result
+
+        # Mark as successful
         if not result.get('error'):
             result['success'] = True
             result['space_url'] = f"https://huggingface.co/spaces/{space_id}"
             result['space_id'] = space_id
             result['files_uploaded'] = len(files)
 
-            print(f"     ✅ Upload complete!")
-            print(f"     🌐 Space URL: {result['space_url']}")
+            log.info(f"     ✅ Upload complete!")
+            log.info(f"     🌐 Space URL: {result['space_url']}")
 
     except Exception as e:
         result['error'] = f"Unexpected error: {str(e)}"
-        print(f"     ❌ {result['error']}")
+        log.error(f"     ❌ {result['error']}")
+    finally:
+        if hf_transfer_enabled:
+            _release_hf_transfer()
 
     return result
 
@@ -579,17 +743,23 @@ def process_space_uploads(
     hf_token: str,
     username: str,
     private: bool = False,
-    force: bool = False
+    force: bool = False,
+    max_workers: int = 4
 ) -> Dict[str, Any]:
     """
     Process Space uploads for all repositories of a paper.
 
+    Uploads are network-bound, so eligible repositories are uploaded
+    concurrently. Repositories that map to the same Space are uploaded
+    one after the other.
+
     Args:
         paper_entry: Paper entry from database
         hf_token: HuggingFace API token
         username: HuggingFace username
         private: Whether to make Spaces private
         force: Force re-upload even if Space exists
+        max_workers: Maximum parallel uploads
 
     Returns:
         Summary dict with upload results
@@ -606,32 +776,53 @@ def process_space_uploads(
     summary['total_repos'] = len(repositories)
 
     if not repositories:
-        print("  ℹ️  No repositories to upload")
+        log.info("  ℹ️  No repositories to upload")
         return summary
 
-    print(f"  📦 Processing {len(repositories)} repositories for Space upload")
+    log.info(f"  📦 Processing {len(repositories)} repositories for Space upload")
 
+    # Only upload cloned repos with code
+    eligible = []
     for idx, repo_entry in enumerate(repositories, 1):
-        # Only upload cloned repos with code
         if repo_entry.get('status') != 'cloned':
-            print(f"  ⏭️  Skipping repo {idx}/{len(repositories)} (not cloned)")
+            log.info(f"  ⏭️  Skipping repo {idx}/{len(repositories)} (not cloned)")
             continue
 
         if not repo_entry.get('has_code', False):
-            print(f"  ⏭️  Skipping repo {idx}/{len(repositories)} (no code)")
+            log.info(f"  ⏭️  Skipping repo {idx}/{len(repositories)} (no code)")
             continue
 
-        print(f"  📤 Uploading repo {idx}/{len(repositories)}...")
+        eligible.append((idx, repo_entry))
 
-        result = upload_to_space(
-            repo_entry,
-            paper_entry,
-            hf_token,
-            username,
-            private=private,
-            force=force
-        )
+    if not eligible:
+        return summary
 
+    # Repos with the same name map to the same Space and must not upload concurrently
+    paper_id = paper_entry.get('paper_id', 'unknown')
+    space_locks: Dict[str, threading.Lock] = {}
+    job_locks = []
+    for _, repo_entry in eligible:
+        github_info = extract_github_info(repo_entry.get('url', ''))
+        target = sanitize_space_name(github_info['repo'], github_info['owner'], paper_id) if github_info else repo_entry.get('url')
+        job_locks.append(space_locks.setdefault(target, threading.Lock()))
+
+    def upload(job: Tuple[int, Dict[str, Any]], lock: threading.Lock) -> Dict[str, Any]:
+        idx, repo_entry = job
+        with lock:
+            log.info(f"  📤 Uploading repo {idx}/{len(repositories)}...")
+            return upload_to_space(
+                repo_entry,
+                paper_entry,
+                hf_token,
+                username,
+                private=private,
+                force=force
+            )
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(eligible)))) as executor:
+        results = list(executor.map(upload, eligible, job_locks))
+
+    for (_, repo_entry), result in zip(eligible, results):
         # Update repo entry with Space info
         repo_entry['space_upload'] = result
 
@@ -59,12 +59,13 @@ def init_paper_entry(paper_id: str, title: str) -> Dict[str, Any]:
     Returns:
         Initialized paper dictionary
     """
+    now = datetime.now().isoformat()
     return {
         'paper_id': paper_id,
         'title': title,
         'processing_status': ProcessingStatus.PENDING,
-        'created_at': datetime.now().isoformat(),
-        'updated_at': datetime.now().isoformat(),
+        'created_at': now,
+        'updated_at': now,
         'processing_steps': {
             'link_extraction': {
                 'status': StepStatus.PENDING,
@@ -135,7 +136,8 @@ def update_step_status(
     Returns:
         Updated paper dictionary
     """
-    paper['updated_at'] = datetime.now().isoformat()
+    now = datetime.now().isoformat()
+    paper['updated_at'] = now
 
     if step_name not in paper['processing_steps']:
         paper['processing_steps'][step_name] = {}
@@ -144,9 +146,9 @@ def update_step_status(
     step['status'] = status
 
     if status == StepStatus.IN_PROGRESS and not step.get('started_at'):
-        step['started_at'] = datetime.now().isoformat()
+        step['started_at'] = now
     elif status in [StepStatus.COMPLETED, StepStatus.ERROR]:
-        step['completed_at'] = datetime.now().isoformat()
+        step['completed_at'] = now
 
     if error:
         step['error'] = error
@@ -2,7 +2,82 @@
 UI helper functions for formatting and displaying data.
 """
 
-from typing import List, Dict, Any
+import heapq
+from html import escape
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping
+
+# Shared read-only fallback for missing sections (never mutated)
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Link categories shown on the paper details page: (key, header, message when empty)
+_LINK_SECTIONS = (
+    ("code_repositories", "💻 Code Repositories", "No code repositories found"),
+    ("model_weights", "🤖 Model Weights", "No model weights found"),
+    ("datasets", "📊 Datasets", "No datasets found"),
+    ("demo_links", "🎮 Demo Links", "No demo links found"),
+    ("paper_links", "📄 Paper Links", "No paper links found"),
+)
+
+# Recent format_papers_display() renders, keyed by a fingerprint of the paper list
+_PAPERS_HTML_CACHE: Dict[tuple, str] = {}
+_PAPERS_HTML_CACHE_SIZE = 16
+
+# HTML templates, filled with str.format_map()
+_PAPER_CARD_TEMPLATE = """
+        <div style="border: 2px solid #475569; padding: 20px; margin: 15px 0; border-radius: 10px; background-color: #1e293b; box-shadow: 0 2px 4px rgba(0,0,0,0.3);">
+            <h3 style="margin-top: 0; color: #fb923c; font-size: 1.3em;">{idx}. {title}</h3>
+            <p style="color: #e2e8f0; margin: 8px 0;"><strong style="color: #f8fafc;">ArXiv ID:</strong> <a href="https://arxiv.org/abs/{paper_id}" target="_blank" style="color: #60a5fa; text-decoration: none;">{paper_id}</a></p>
+            <p style="color: #e2e8f0; margin: 8px 0;"><strong style="color: #f8fafc;">Authors:</strong> {author_names}</p>
+            <p style="color: #e2e8f0; margin: 8px 0;"><strong style="color: #f8fafc;">Published:</strong> {published_at}</p>
+            <p style="color: #e2e8f0; margin: 8px 0;"><strong style="color: #f8fafc;">Upvotes:</strong> ❤️ {upvotes}</p>
+            <details style="margin-top: 12px;">
+                <summary style="cursor: pointer; color: #60a5fa; font-weight: bold; padding: 5px 0;"><strong>Summary</strong></summary>
+                <p style="margin-top: 10px; text-align: justify; color: #e2e8f0; line-height: 1.6;">{summary}</p>
+            </details>
+        </div>
+        """
+
+_REPO_CARD_TEMPLATE = """
+            <div style="border-left: 4px solid {status_color}; padding: 10px; margin: 10px 0; background-color: #334155;">
+                <p style="color: #e2e8f0; margin: 4px 0;"><strong>URL:</strong> <a href="{repo_url}" target="_blank" style="color: #60a5fa;">{repo_url}</a></p>
+                <p style="color: #e2e8f0; margin: 4px 0;"><strong>Status:</strong> <span style="color: {status_color};">{repo_status}</span></p>
+                <p style="color: #e2e8f0; margin: 4px 0;"><strong>Has Code:</strong> {has_code}</p>
+                {languages_html}
+                {claude_init_html}
+                {gradio_gen_html}
+                {space_upload_html}
+                {path_html}
+            </div>
+            """
+
+_LINK_ITEM_TEMPLATE = '<li><a href="{0}" target="_blank" style="color: #60a5fa; text-decoration: none;">{0}</a></li>'
+_LANGUAGES_TEMPLATE = '<p style="color: #e2e8f0; margin: 4px 0;"><strong>Languages:</strong> {}</p>'
+_PATH_TEMPLATE = '<p style="color: #e2e8f0; margin: 4px 0; font-size: 0.9em;"><strong>Path:</strong> <code style="color: #cbd5e1;">{}</code></p>'
+
+
+class _PaperView:
+    """A paper's links and processing step sections, unwrapped once with empty-dict fallbacks."""
+
+    __slots__ = ('links', 'repo_analysis', 'claude_init', 'gradio_generation', 'space_upload')
+
+    def __init__(self, paper: Dict[str, Any]):
+        self.links = paper.get('links') or _EMPTY
+        steps = paper.get('processing_steps') or _EMPTY
+        self.repo_analysis = steps.get('repo_analysis') or _EMPTY
+        self.claude_init = steps.get('claude_init') or _EMPTY
+        self.gradio_generation = steps.get('gradio_generation') or _EMPTY
+        self.space_upload = steps.get('space_upload') or _EMPTY
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, adding '...' when anything was removed."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+def _esc(value: Any) -> str:
+    """HTML-escape any value for interpolation into text or a quoted attribute."""
+    return escape(str(value))
 
 
 def format_papers_display(papers: List[Dict[str, Any]]) -> str:
@@ -18,7 +93,19 @@ def format_papers_display(papers: List[Dict[str, Any]]) -> str:
     if not papers:
         return "<p>No papers found or error fetching data.</p>"
 
-    html = f"<h2>📚 Daily Papers ({len(papers)} papers)</h2>"
+    # Identical paper lists render identically, so reuse a recent render
+    fingerprint = tuple(
+        (paper.get('paper', {}).get('id'), paper.get('upvotes', 0), paper.get('title'))
+        for paper in papers
+    )
+    cached = _PAPERS_HTML_CACHE.get(fingerprint)
+    if cached is not None:
+        return cached
+
+    # One slot for the header plus one per paper, filled by index
+    parts = [None] * (len(papers) + 1)
+    parts[0] = f"<h2>📚 Daily Papers ({len(papers)} papers)</h2>"
+    esc = _esc
 
     for idx, paper in enumerate(papers, 1):
         title = paper.get('title', 'No title')
@@ -29,24 +116,26 @@ def format_papers_display(papers: List[Dict[str, Any]]) -> str:
         upvotes = paper.get('upvotes', 0)
 
         # Format authors
-        author_names = ", ".join([author.get('name', 'Unknown') for author in authors[:3]])
-        if len(authors) > 3:
-            author_names += f" et al. ({len(authors)} authors)"
-
-        html += f"""
-        <div style="border: 2px solid #475569; padding: 20px; margin: 15px 0; border-radius: 10px; background-color: #1e293b; box-shadow: 0 2px 4px rgba(0,0,0,0.3);">
-            <h3 style="margin-top: 0; color: #fb923c; font-size: 1.3em;">{idx}. {title}</h3>
-            <p style="color: #e2e8f0; margin: 8px 0;"><strong style="color: #f8fafc;">ArXiv ID:</strong> <a href="https://arxiv.org/abs/{paper_id}" target="_blank" style="color: #60a5fa; text-decoration: none;">{paper_id}</a></p>
-            <p style="color: #e2e8f0; margin: 8px 0;"><strong style="color: #f8fafc;">Authors:</strong> {author_names}</p>
-            <p style="color: #e2e8f0; margin: 8px 0;"><strong style="color: #f8fafc;">Published:</strong> {published_at}</p>
-            <p style="color: #e2e8f0; margin: 8px 0;"><strong style="color: #f8fafc;">Upvotes:</strong> ❤️ {upvotes}</p>
-            <details style="margin-top: 12px;">
-                <summary style="cursor: pointer; color: #60a5fa; font-weight: bold; padding: 5px 0;"><strong>Summary</strong></summary>
-                <p style="margin-top: 10px; text-align: justify; color: #e2e8f0; line-height: 1.6;">{summary}</p>
-            </details>
-        </div>
-        """
-
+        n_authors = len(authors)
+        author_names = ", ".join(esc(author.get('name', 'Unknown')) for author in authors[:3])
+        if n_authors > 3:
+            author_names += f" et al. ({n_authors} authors)"
+
+        parts[idx] = _PAPER_CARD_TEMPLATE.format_map({
+            'idx': idx,
+            'title': esc(title),
+            'paper_id': esc(paper_id),
+            'author_names': author_names,
+            'published_at': esc(published_at),
+            'upvotes': upvotes,
+            'summary': esc(summary),
+        })
+
+    html = "".join(parts)
+    if len(_PAPERS_HTML_CACHE) >= _PAPERS_HTML_CACHE_SIZE:
+        # Evict the oldest render
+        _PAPERS_HTML_CACHE.pop(next(iter(_PAPERS_HTML_CACHE), None), None)
+    _PAPERS_HTML_CACHE[fingerprint] = html
     return html
 
 
@@ -67,35 +156,41 @@ def get_database_stats(database: Dict[str, Any]) -> str:
 
     total_papers = len(papers)
 
-    # Count links by category
-    total_code = sum(len(p.get("links", {}).get("code_repositories", [])) for p in papers)
-    total_models = sum(len(p.get("links", {}).get("model_weights", [])) for p in papers)
-    total_datasets = sum(len(p.get("links", {}).get("datasets", [])) for p in papers)
-    total_demos = sum(len(p.get("links", {}).get("demo_links", [])) for p in papers)
-    total_paper_links = sum(len(p.get("links", {}).get("paper_links", [])) for p in papers)
+    # Count links, repos, Claude initializations, Gradio apps and Spaces in one pass
+    total_code = total_models = total_datasets = total_demos = total_paper_links = 0
+    total_repos_found = total_repos_cloned = 0
+    total_repos_initialized = 0
+    claude_available = False
+    total_apps_created = 0
+    total_spaces_created = 0
+    total_space_urls = []
 
-    # Count repos
-    total_repos_found = sum(p.get('processing_steps', {}).get('repo_analysis', {}).get('repos_found', 0) for p in papers)
-    total_repos_cloned = sum(p.get('processing_steps', {}).get('repo_analysis', {}).get('repos_cloned', 0) for p in papers)
+    for p in papers:
+        view = _PaperView(p)
+        links = view.links
+        total_code += len(links.get("code_repositories") or ())
+        total_models += len(links.get("model_weights") or ())
+        total_datasets += len(links.get("datasets") or ())
+        total_demos += len(links.get("demo_links") or ())
+        total_paper_links += len(links.get("paper_links") or ())
 
-    # Count claude initializations
-    total_repos_initialized = sum(p.get('processing_steps', {}).get('claude_init', {}).get('repos_initialized', 0) for p in papers)
-    claude_available = any(p.get('processing_steps', {}).get('claude_init', {}).get('claude_available', False) for p in papers)
+        total_repos_found += view.repo_analysis.get('repos_found', 0)
+        total_repos_cloned += view.repo_analysis.get('repos_cloned', 0)
 
-    # Count Gradio apps generated
-    total_apps_created = sum(p.get('processing_steps', {}).get('gradio_generation', {}).get('apps_created', 0) for p in papers)
+        total_repos_initialized += view.claude_init.get('repos_initialized', 0)
+        # Stop looking once any paper saw the CLI; every paper is still visited for the counters
+        if not claude_available and view.claude_init.get('claude_available'):
+            claude_available = True
 
-    # Count Spaces uploaded
-    total_spaces_created = sum(p.get('processing_steps', {}).get('space_upload', {}).get('spaces_created', 0) for p in papers)
-    total_space_urls = []
-    for p in papers:
-        urls = p.get('processing_steps', {}).get('space_upload', {}).get('space_urls', [])
-        total_space_urls.extend(urls)
+        total_apps_created += view.gradio_generation.get('apps_created', 0)
+
+        total_spaces_created += view.space_upload.get('spaces_created', 0)
+        total_space_urls.extend(view.space_upload.get('space_urls') or ())
 
     # Get most recent papers
-    recent_papers = sorted(papers, key=lambda x: x.get("created_at", ""), reverse=True)[:5]
+    recent_papers = heapq.nlargest(5, papers, key=lambda p: p.get("created_at", ""))
 
-    html = f"""
+    parts = [f"""
     <div style="padding: 20px; background-color: #1e293b; border-radius: 10px; border: 2px solid #475569; box-shadow: 0 2px 4px rgba(0,0,0,0.3);">
         <h3 style="color: #fb923c; margin-top: 0;">📊 Database Statistics</h3>
         <p style="color: #e2e8f0; font-size: 1.1em;"><strong style="color: #f8fafc;">Total Papers:</strong> {total_papers}</p>
@@ -119,21 +214,22 @@ def get_database_stats(database: Dict[str, Any]) -> str:
 
         <h4 style="color: #60a5fa; margin-top: 20px;">Recently Added Papers:</h4>
         <ul style="color: #e2e8f0; line-height: 1.8;">
-    """
+    """]
 
     for paper in recent_papers:
         paper_id = paper.get("paper_id", "Unknown")
         title = paper.get("title", "No title")
-        created_at = paper.get("created_at", "Unknown")
+        created_at = paper.get("created_at") or "Unknown"
         status = paper.get("processing_status", "unknown")
-        html += f"<li><strong style='color: #f8fafc;'>{paper_id}</strong>: {title[:60]}{'...' if len(title) > 60 else ''} <em style='color: #cbd5e1;'>(added {created_at[:10]}, status: {status})</em></li>\n"
+        display_title = _truncate(title, 60)
+        parts.append(f"<li><strong style='color: #f8fafc;'>{_esc(paper_id)}</strong>: {_esc(display_title)} <em style='color: #cbd5e1;'>(added {_esc(created_at[:10])}, status: {_esc(status)})</em></li>\n")
 
-    html += """
+    parts.append("""
         </ul>
     </div>
-    """
+    """)
 
-    return html
+    return "".join(parts)
 
 
 def view_paper_details(paper: Dict[str, Any]) -> str:
@@ -152,73 +248,32 @@ def view_paper_details(paper: Dict[str, Any]) -> str:
     paper_id = paper.get("paper_id", "Unknown")
     title = paper.get("title", "No title")
     processing_status = paper.get("processing_status", "unknown")
-    created_at = paper.get("created_at", "Unknown")
-    links = paper.get("links", {})
+    created_at = paper.get("created_at") or "Unknown"
+    links = _PaperView(paper).links
     repositories = paper.get("repositories", [])
 
-    html = f"""
+    parts = [f"""
     <div style="padding: 20px; background-color: #1e293b; border-radius: 10px; border: 2px solid #475569; box-shadow: 0 2px 4px rgba(0,0,0,0.3);">
-        <h3 style="color: #fb923c; margin-top: 0;">{title}</h3>
-        <p style="color: #e2e8f0; margin: 8px 0;"><strong style="color: #f8fafc;">Paper ID:</strong> {paper_id}</p>
-        <p style="color: #e2e8f0; margin: 8px 0;"><strong style="color: #f8fafc;">Processing Status:</strong> <span style="background-color: #334155; color: #e2e8f0; padding: 2px 8px; border-radius: 4px;">{processing_status}</span></p>
-        <p style="color: #e2e8f0; margin: 8px 0;"><strong style="color: #f8fafc;">Created:</strong> {created_at}</p>
+        <h3 style="color: #fb923c; margin-top: 0;">{_esc(title)}</h3>
+        <p style="color: #e2e8f0; margin: 8px 0;"><strong style="color: #f8fafc;">Paper ID:</strong> {_esc(paper_id)}</p>
+        <p style="color: #e2e8f0; margin: 8px 0;"><strong style="color: #f8fafc;">Processing Status:</strong> <span style="background-color: #334155; color: #e2e8f0; padding: 2px 8px; border-radius: 4px;">{_esc(processing_status)}</span></p>
+        <p style="color: #e2e8f0; margin: 8px 0;"><strong style="color: #f8fafc;">Created:</strong> {_esc(created_at)}</p>
 
         <h4 style="color: #60a5fa; margin-top: 20px;">🔗 Extracted Links:</h4>
-    """
+    """]
 
-    # Code repositories
-    code_repos = links.get("code_repositories", [])
-    if code_repos:
-        html += "<h5 style='color: #e2e8f0; margin-top: 15px;'>💻 Code Repositories:</h5><ul style='color: #e2e8f0; line-height: 1.8;'>"
-        for link in code_repos:
-            html += f'<li><a href="{link}" target="_blank" style="color: #60a5fa; text-decoration: none;">{link}</a></li>'
-        html += "</ul>"
-    else:
-        html += "<p style='color: #94a3b8; font-style: italic; margin: 10px 0;'>No code repositories found</p>"
-
-    # Model weights
-    models = links.get("model_weights", [])
-    if models:
-        html += "<h5 style='color: #e2e8f0; margin-top: 15px;'>🤖 Model Weights:</h5><ul style='color: #e2e8f0; line-height: 1.8;'>"
-        for link in models:
-            html += f'<li><a href="{link}" target="_blank" style="color: #60a5fa; text-decoration: none;">{link}</a></li>'
-        html += "</ul>"
-    else:
-        html += "<p style='color: #94a3b8; font-style: italic; margin: 10px 0;'>No model weights found</p>"
-
-    # Datasets
-    datasets = links.get("datasets", [])
-    if datasets:
-        html += "<h5 style='color: #e2e8f0; margin-top: 15px;'>📊 Datasets:</h5><ul style='color: #e2e8f0; line-height: 1.8;'>"
-        for link in datasets:
-            html += f'<li><a href="{link}" target="_blank" style="color: #60a5fa; text-decoration: none;">{link}</a></li>'
-        html += "</ul>"
-    else:
-        html += "<p style='color: #94a3b8; font-style: italic; margin: 10px 0;'>No datasets found</p>"
-
-    # Demo links
-    demos = links.get("demo_links", [])
-    if demos:
-        html += "<h5 style='color: #e2e8f0; margin-top: 15px;'>🎮 Demo Links:</h5><ul style='color: #e2e8f0; line-height: 1.8;'>"
-        for link in demos:
-            html += f'<li><a href="{link}" target="_blank" style="color: #60a5fa; text-decoration: none;">{link}</a></li>'
-        html += "</ul>"
-    else:
-        html += "<p style='color: #94a3b8; font-style: italic; margin: 10px 0;'>No demo links found</p>"
-
-    # Paper links
-    paper_links = links.get("paper_links", [])
-    if paper_links:
-        html += "<h5 style='color: #e2e8f0; margin-top: 15px;'>📄 Paper Links:</h5><ul style='color: #e2e8f0; line-height: 1.8;'>"
-        for link in paper_links:
-            html += f'<li><a href="{link}" target="_blank" style="color: #60a5fa; text-decoration: none;">{link}</a></li>'
-        html += "</ul>"
-    else:
-        html += "<p style='color: #94a3b8; font-style: italic; margin: 10px 0;'>No paper links found</p>"
+    for key, header, empty_message in _LINK_SECTIONS:
+        urls = links.get(key, [])
+        if urls:
+            parts.append(f"<h5 style='color: #e2e8f0; margin-top: 15px;'>{header}:</h5><ul style='color: #e2e8f0; line-height: 1.8;'>")
+            parts.append("".join(_LINK_ITEM_TEMPLATE.format(_esc(link)) for link in urls))
+            parts.append("</ul>")
+        else:
+            parts.append(f"<p style='color: #94a3b8; font-style: italic; margin: 10px 0;'>{empty_message}</p>")
 
     # Repository information
     if repositories:
-        html += "<h4 style='color: #60a5fa; margin-top: 20px;'>📦 Cloned Repositories:</h4>"
+        parts.append("<h4 style='color: #60a5fa; margin-top: 20px;'>📦 Cloned Repositories:</h4>")
         for repo in repositories:
             repo_url = repo.get('url', 'Unknown')
             repo_status = repo.get('status', 'unknown')
@@ -241,7 +296,7 @@ def view_paper_details(paper: Dict[str, Any]) -> str:
                         <span style="color: #4ade80;">✅ CLAUDE.md created</span>
                     </p>
                     <p style="color: #e2e8f0; margin: 4px 0; font-size: 0.9em;">
-                        <strong>CLAUDE.md:</strong> <code style="color: #cbd5e1;">{claude_md_path}</code>
+                        <strong>CLAUDE.md:</strong> <code style="color: #cbd5e1;">{_esc(claude_md_path)}</code>
                     </p>
                     """
                 elif claude_init.get('attempted'):
@@ -252,7 +307,7 @@ def view_paper_details(paper: Dict[str, Any]) -> str:
                         <span style="color: #f87171;">❌ Failed</span>
                     </p>
                     <p style="color: #94a3b8; margin: 4px 0; font-size: 0.85em; font-style: italic;">
-                        Error: {error[:100]}{'...' if len(error) > 100 else ''}
+                        Error: {_esc(_truncate(error, 100))}
                     </p>
                     """
                 elif not claude_init.get('claude_available'):
@@ -275,7 +330,7 @@ def view_paper_details(paper: Dict[str, Any]) -> str:
                         <span style="color: #4ade80;">✅ Generated</span>
                     </p>
                     <p style="color: #e2e8f0; margin: 4px 0; font-size: 0.9em;">
-                        <strong>app.py:</strong> <code style="color: #cbd5e1;">{app_path}</code>
+                        <strong>app.py:</strong> <code style="color: #cbd5e1;">{_esc(app_path)}</code>
                     </p>
                     {f'<p style="color: #e2e8f0; margin: 4px 0; font-size: 0.9em;"><strong>README.md:</strong> <span style="color: #4ade80;">✓ HF YAML header added</span></p>' if readme_updated else ''}
                     """
@@ -287,7 +342,7 @@ def view_paper_details(paper: Dict[str, Any]) -> str:
                         <span style="color: #f87171;">❌ Failed</span>
                     </p>
                     <p style="color: #94a3b8; margin: 4px 0; font-size: 0.85em; font-style: italic;">
-                        Error: {error[:100]}{'...' if len(error) > 100 else ''}
+                        Error: {_esc(_truncate(error, 100))}
                     </p>
                     """
 
@@ -308,7 +363,7 @@ def view_paper_details(paper: Dict[str, Any]) -> str:
                         <span style="color: #4ade80;">✅ Uploaded</span>
                     </p>
                     <p style="color: #e2e8f0; margin: 4px 0; font-size: 0.9em;">
-                        <strong>Space URL:</strong> <a href="{space_url}" target="_blank" style="color: #60a5fa; text-decoration: none; font-weight: bold;">{space_id}</a>
+                        <strong>Space URL:</strong> <a href="{_esc(space_url)}" target="_blank" style="color: #60a5fa; text-decoration: none; font-weight: bold;">{_esc(space_id)}</a>
                     </p>
                     <p style="color: #94a3b8; margin: 4px 0; font-size: 0.85em;">
                         {files_uploaded} files • {total_size_mb}MB total
@@ -323,23 +378,22 @@ def view_paper_details(paper: Dict[str, Any]) -> str:
                         <span style="color: #f87171;">❌ Upload Failed</span>
                     </p>
                     <p style="color: #94a3b8; margin: 4px 0; font-size: 0.85em; font-style: italic;">
-                        Error: {error[:100]}{'...' if len(error) > 100 else ''}
+                        Error: {_esc(_truncate(error, 100))}
                     </p>
                     """
 
-            html += f"""
-            <div style="border-left: 4px solid {status_color}; padding: 10px; margin: 10px 0; background-color: #334155;">
-                <p style="color: #e2e8f0; margin: 4px 0;"><strong>URL:</strong> <a href="{repo_url}" target="_blank" style="color: #60a5fa;">{repo_url}</a></p>
-                <p style="color: #e2e8f0; margin: 4px 0;"><strong>Status:</strong> <span style="color: {status_color};">{repo_status}</span></p>
-                <p style="color: #e2e8f0; margin: 4px 0;"><strong>Has Code:</strong> {'✅ Yes' if has_code else '❌ No'}</p>
-                {f'<p style="color: #e2e8f0; margin: 4px 0;"><strong>Languages:</strong> {", ".join(languages)}</p>' if languages else ''}
-                {claude_init_html}
-                {gradio_gen_html}
-                {space_upload_html}
-                {f'<p style="color: #e2e8f0; margin: 4px 0; font-size: 0.9em;"><strong>Path:</strong> <code style="color: #cbd5e1;">{clone_path}</code></p>' if clone_path != 'N/A' else ''}
-            </div>
-            """
-
-    html += "</div>"
-
-    return html
+            parts.append(_REPO_CARD_TEMPLATE.format_map({
+                'status_color': status_color,
+                'repo_url': _esc(repo_url),
+                'repo_status': _esc(repo_status),
+                'has_code': '✅ Yes' if has_code else '❌ No',
+                'languages_html': _LANGUAGES_TEMPLATE.format(_esc(", ".join(languages))) if languages else '',
+                'claude_init_html': claude_init_html,
+                'gradio_gen_html': gradio_gen_html,
+                'space_upload_html': space_upload_html,
+                'path_html': _PATH_TEMPLATE.format(_esc(clone_path)) if clone_path != 'N/A' else '',
+            }))
+
+    parts.append("</div>")
+
+    return "".join(parts)
@@ -6,44 +6,53 @@ Test script to verify Claude CLI detection works correctly.
 import os
 import sys
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# The script's own directory is on sys.path when run directly, so src is importable
+from src.claude_init import check_claude_available
 
-from claude_init import check_claude_available
+
+def flush(out):
+    """Write buffered output lines in one call and clear the buffer."""
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
+        out.clear()
 
 def test_claude_detection():
     """Test if Claude CLI can be detected."""
-    print("🔍 Testing Claude CLI detection...")
-    print()
+    out = []
+    out.append("🔍 Testing Claude CLI detection...")
+    out.append("")
 
     # Check environment variable
     env_path = os.environ.get('CLAUDE_CLI_PATH')
     if env_path:
-        print(f"   CLAUDE_CLI_PATH environment variable: {env_path}")
+        out.append(f"   CLAUDE_CLI_PATH environment variable: {env_path}")
     else:
-        print(f"   CLAUDE_CLI_PATH environment variable: Not set")
+        out.append(f"   CLAUDE_CLI_PATH environment variable: Not set")
 
-    print()
+    out.append("")
 
-    # Try to find Claude
+    # Try to find Claude (it logs its own progress, so emit ours first)
+    flush(out)
     claude_path = check_claude_available()
 
-    print()
+    out.append("")
     if claude_path:
-        print(f"✅ Claude CLI found at: {claude_path}")
-        print()
-        print("   Claude initialization will be enabled for cloned repositories.")
+        out.append(f"✅ Claude CLI found at: {claude_path}")
+        out.append("")
+        out.append("   Claude initialization will be enabled for cloned repositories.")
+        flush(out)
         return True
     else:
-        print("❌ Claude CLI not found")
-        print()
-        print("   Claude initialization will be skipped.")
-        print("   To enable it, install Claude CLI:")
-        print("   • npm install -g @anthropic-ai/claude-code")
-        print("   • brew install --cask claude-code")
-        print("   • curl -fsSL https://claude.ai/install.sh | bash")
-        print()
-        print("   Or set CLAUDE_CLI_PATH to point to your Claude executable.")
+        out.append("❌ Claude CLI not found")
+        out.append("")
+        out.append("   Claude initialization will be skipped.")
+        out.append("   To enable it, install Claude CLI:")
+        out.append("   • npm install -g @anthropic-ai/claude-code")
+        out.append("   • brew install --cask claude-code")
+        out.append("   • curl -fsSL https://claude.ai/install.sh | bash")
+        out.append("")
+        out.append("   Or set CLAUDE_CLI_PATH to point to your Claude executable.")
+        flush(out)
         return False
 
 if __name__ == "__main__":
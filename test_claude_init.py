@@ -6,24 +6,32 @@ Test script to verify Claude initialization works correctly.
 import os
 import sys
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# The script's own directory is on sys.path when run directly, so src is importable
+from src.claude_init import check_claude_available, initialize_repository
 
-from claude_init import check_claude_available, initialize_repository
+
+def flush(out):
+    """Write buffered output lines in one call and clear the buffer."""
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
+        out.clear()
 
 def test_claude_init():
     """Test Claude initialization on a test repository."""
-    print("🧪 Testing Claude initialization...")
-    print()
+    out = []
+    out.append("🧪 Testing Claude initialization...")
+    out.append("")
 
-    # Check if Claude is available
+    # Check if Claude is available (it logs its own progress, so emit ours first)
+    flush(out)
     claude_path = check_claude_available()
     if not claude_path:
-        print("❌ Claude CLI not available, cannot test initialization")
+        out.append("❌ Claude CLI not available, cannot test initialization")
+        flush(out)
         return False
 
-    print(f"✅ Claude CLI found at: {claude_path}")
-    print()
+    out.append(f"✅ Claude CLI found at: {claude_path}")
+    out.append("")
 
     # Create a test repository entry
     test_repo = {
@@ -34,45 +42,49 @@ def test_claude_init():
         'languages': ['Python']
     }
 
-    print(f"📂 Testing initialization on: {test_repo['clone_path']}")
-    print()
+    out.append(f"📂 Testing initialization on: {test_repo['clone_path']}")
+    out.append("")
 
     # Run initialization
+    flush(out)
     result = initialize_repository(test_repo)
 
-    print()
-    print("📊 Initialization results:")
-    print(f"   Attempted: {result['attempted']}")
-    print(f"   Success: {result['success']}")
-    print(f"   Claude available: {result['claude_available']}")
-    print(f"   CLAUDE.md exists: {result['claude_md_exists']}")
-    print(f"   CLAUDE.md path: {result['claude_md_path']}")
+    out.append("")
+    out.append("📊 Initialization results:")
+    out.append(f"   Attempted: {result['attempted']}")
+    out.append(f"   Success: {result['success']}")
+    out.append(f"   Claude available: {result['claude_available']}")
+    out.append(f"   CLAUDE.md exists: {result['claude_md_exists']}")
+    out.append(f"   CLAUDE.md path: {result['claude_md_path']}")
     if result['error']:
-        print(f"   Error: {result['error']}")
+        out.append(f"   Error: {result['error']}")
 
-    print()
+    out.append("")
 
     # Check if CLAUDE.md was created
     if result['success']:
         claude_md_path = result['claude_md_path']
         if claude_md_path and os.path.isfile(claude_md_path):
             file_size = os.path.getsize(claude_md_path)
-            print(f"✅ CLAUDE.md successfully created ({file_size} bytes)")
+            out.append(f"✅ CLAUDE.md successfully created ({file_size} bytes)")
 
             # Show first few lines
             with open(claude_md_path, 'r') as f:
                 lines = f.readlines()[:10]
-            print()
-            print("   First 10 lines of CLAUDE.md:")
+            out.append("")
+            out.append("   First 10 lines of CLAUDE.md:")
             for i, line in enumerate(lines, 1):
-                print(f"   {i:2d}: {line.rstrip()}")
+                out.append(f"   {i:2d}: {line.rstrip()}")
 
+            flush(out)
             return True
         else:
-            print("❌ CLAUDE.md was reported as created but file doesn't exist")
+            out.append("❌ CLAUDE.md was reported as created but file doesn't exist")
+            flush(out)
             return False
     else:
-        print("❌ Claude initialization failed")
+        out.append("❌ Claude initialization failed")
+        flush(out)
         return False
 
 if __name__ == "__main__":
@@ -1,70 +1,124 @@
 #!/usr/bin/env python3
 """
 Quick test script to verify link extraction works correctly.
+
+Usage:
+    python test_extraction.py                    # Run the built-in cases
+    python test_extraction.py PAPER_ID           # Same, the single-paper default
+    python test_extraction.py PAPER_ID EXPECTED_URL [PAPER_ID EXPECTED_URL ...]
 """
 
 import sys
-sys.path.insert(0, '.')
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
 
+# The script's own directory is on sys.path when run directly, so src is importable
 from src.papers import fetch_paper_page, extract_links_from_html
 
-# Test with the problematic paper
-paper_id = "2411.01156"
-paper_title = "Fish-Speech: Leveraging Large Language Models for Advanced Multilingual Text-to-Speech Synthesis"
+# (paper_id, paper_title, expected code repository URL)
+CASES = [
+    # The problematic paper
+    (
+        "2411.01156",
+        "Fish-Speech: Leveraging Large Language Models for Advanced Multilingual Text-to-Speech Synthesis",
+        "https://github.com/fishaudio/fish-speech",
+    ),
+]
+
+
+def run_test(paper_id: str, paper_title: str, expected_url: str) -> Tuple[bool, List[str]]:
+    """
+    Fetch one paper page, extract its links and check for the expected URL.
+
+    Output is collected rather than printed, so concurrent runs don't interleave.
 
-print(f"Testing link extraction for paper {paper_id}...")
-print(f"Title: {paper_title}\n")
+    Returns:
+        Tuple of (passed, output lines)
+    """
+    out = [f"Testing link extraction for paper {paper_id}...", f"Title: {paper_title}\n"]
 
-# Fetch the page
-print("Fetching paper page...")
-html_content = fetch_paper_page(paper_id)
+    # Fetch the page
+    out.append("Fetching paper page...")
+    html_content = fetch_paper_page(paper_id)
 
-if not html_content:
-    print("❌ Failed to fetch paper page")
-    sys.exit(1)
+    if not html_content:
+        out.append("❌ Failed to fetch paper page")
+        return False, out
 
-print(f"✅ Fetched {len(html_content)} characters of HTML\n")
+    out.append(f"✅ Fetched {len(html_content)} characters of HTML\n")
 
-# Extract links
-print("Extracting links...")
-result = extract_links_from_html(paper_id, paper_title, html_content)
+    # Extract links
+    out.append("Extracting links...")
+    result = extract_links_from_html(paper_id, paper_title, html_content)
 
-# Print results
-print("\n" + "="*60)
-print("EXTRACTION RESULTS")
-print("="*60)
+    # Print results
+    out.append("\n" + "="*60)
+    out.append("EXTRACTION RESULTS")
+    out.append("="*60)
 
-if "error" in result:
-    print(f"❌ Error: {result['error']}")
-    sys.exit(1)
+    if "error" in result:
+        out.append(f"❌ Error: {result['error']}")
+        return False, out
 
-links = result.get('links', {})
-total_found = result.get('total_links_found', 0)
-total_categorized = result.get('total_links_categorized', 0)
+    links = result.get('links', {})
+    total_found = result.get('total_links_found', 0)
+    total_categorized = result.get('total_links_categorized', 0)
 
-print(f"\nTotal URLs found: {total_found}")
-print(f"Total URLs categorized: {total_categorized}")
-print(f"\nCategorized links:")
+    out.append(f"\nTotal URLs found: {total_found}")
+    out.append(f"Total URLs categorized: {total_categorized}")
+    out.append(f"\nCategorized links:")
 
-for category, urls in links.items():
-    if urls:
-        print(f"\n{category.replace('_', ' ').title()} ({len(urls)}):")
-        for url in urls:
-            print(f"  • {url}")
+    for category, urls in links.items():
+        if urls:
+            out.append(f"\n{category.replace('_', ' ').title()} ({len(urls)}):")
+            for url in urls:
+                out.append(f"  • {url}")
 
-# Verify we found the expected GitHub link
-github_urls = links.get('code_repositories', [])
-expected_url = "https://github.com/fishaudio/fish-speech"
+    # Verify we found the expected GitHub link
+    github_urls = links.get('code_repositories', [])
 
-if expected_url in github_urls:
-    print(f"\n✅ SUCCESS! Found the expected GitHub URL: {expected_url}")
-else:
-    print(f"\n❌ FAILED! Did not find expected GitHub URL: {expected_url}")
-    print(f"   Found {len(github_urls)} GitHub URLs instead:")
+    if expected_url in github_urls:
+        out.append(f"\n✅ SUCCESS! Found the expected GitHub URL: {expected_url}")
+        return True, out
+
+    out.append(f"\n❌ FAILED! Did not find expected GitHub URL: {expected_url}")
+    out.append(f"   Found {len(github_urls)} GitHub URLs instead:")
     for url in github_urls:
-        print(f"   • {url}")
-    sys.exit(1)
+        out.append(f"   • {url}")
+    return False, out
+
+
+def main() -> int:
+    """Run the cases given on the command line, or CASES. Returns the exit code."""
+    args = sys.argv[1:]
+    cases = CASES
+    if len(args) > 1:
+        if len(args) % 2:
+            sys.stderr.write("Usage:" + __doc__.split("Usage:", 1)[1].rstrip() + "\n")
+            sys.stderr.write("error: expected PAPER_ID EXPECTED_URL pairs\n")
+            return 2
+        cases = [(paper_id, paper_id, expected_url) for paper_id, expected_url in zip(args[::2], args[1::2])]
+
+    if not cases:
+        sys.stderr.write("error: no test cases to run\n")
+        return 1
+
+    # Fetching is network-bound, so papers are tested concurrently
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(cases)))) as executor:
+        results = list(executor.map(lambda case: run_test(*case), cases))
+
+    report = []
+    for passed, out in results:
+        report.extend(out)
+        report.append("")
+    all_passed = all(passed for passed, _ in results)
+
+    if all_passed:
+        report += ["="*60, "✅ All tests passed!", "="*60]
+
+    sys.stdout.write("\n".join(report) + "\n")
+    return 0 if all_passed else 1
+
 
-print("\n" + "="*60)
-print("✅ All tests passed!")
-print("="*60)
+if __name__ == "__main__":
+    sys.exit(main())